@@ -0,0 +1,35 @@
+# Location: backend/alembic/versions/017_add_queue_skill_status_index.py
+"""add composite skill_name/status index to validation_queue
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-12-17 10:00:00.000000
+
+Module #5: Skill Validation System
+Queue ingestion checks whether a skill is already queued before
+inserting. A composite (skill_name, status) index serves that lookup
+(and skill_name + status filters) from a single index, so the
+single-column skill_name index is dropped.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace skill_name index with (skill_name, status)"""
+    
+    op.create_index('idx_queue_skill_status', 'validation_queue', ['skill_name', 'status'])
+    op.drop_index('idx_queue_skill_name', 'validation_queue')
+
+
+def downgrade():
+    """Restore single-column skill_name index"""
+    
+    op.create_index('idx_queue_skill_name', 'validation_queue', ['skill_name'])
+    op.drop_index('idx_queue_skill_status', 'validation_queue')
@@ -0,0 +1,68 @@
+# Location: backend/alembic/versions/018_add_queue_skill_name_unique.py
+"""add unique constraint on validation_queue.skill_name
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-12-17 11:00:00.000000
+
+Module #5: Skill Validation System
+QueueManagerService.add_to_queue upserts with
+INSERT ... ON DUPLICATE KEY UPDATE, which needs skill_name to be unique.
+Ingestion only did check-then-insert, so existing data can hold
+duplicates (including case variants under the ci collation). They are
+merged first: per skill_name the row to keep is a non-pending one if
+any, then the highest source_count, then the lowest id; it takes the
+group's highest source_count and the other rows are deleted.
+
+The unique index serves skill_name lookups, so the (skill_name, status)
+index from 017 is dropped.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+# Per skill_name: rank 1 is the row kept, max_count the group's highest count
+RANKED_QUEUE = """
+    SELECT id,
+           MAX(source_count) OVER (PARTITION BY skill_name) AS max_count,
+           ROW_NUMBER() OVER (
+               PARTITION BY skill_name
+               ORDER BY status <> 'pending' DESC, source_count DESC, id
+           ) AS rn
+    FROM validation_queue
+"""
+
+
+def upgrade():
+    """Merge duplicate skill_name rows, then make skill_name unique"""
+    
+    # Keeper takes the highest source_count of its group
+    op.execute(f"""
+        UPDATE validation_queue q
+        JOIN ({RANKED_QUEUE}) ranked ON ranked.id = q.id
+        SET q.source_count = ranked.max_count
+        WHERE ranked.rn = 1 AND q.source_count < ranked.max_count
+    """)
+    
+    # Drop the rest
+    op.execute(f"""
+        DELETE q FROM validation_queue q
+        JOIN ({RANKED_QUEUE}) ranked ON ranked.id = q.id
+        WHERE ranked.rn > 1
+    """)
+    
+    op.create_unique_constraint('uq_queue_skill_name', 'validation_queue', ['skill_name'])
+    op.drop_index('idx_queue_skill_status', 'validation_queue')
+
+
+def downgrade():
+    """Drop skill_name unique constraint (merged duplicates are not restored)"""
+    
+    op.create_index('idx_queue_skill_status', 'validation_queue', ['skill_name', 'status'])
+    op.drop_constraint('uq_queue_skill_name', 'validation_queue', type_='unique')
@@ -0,0 +1,65 @@
+# Location: backend/alembic/versions/019_server_side_timestamps.py
+"""use server-side timestamp defaults for skill validation tables
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-12-17 12:00:00.000000
+
+Module #5: Skill Validation System
+created_at/updated_at were filled in by Python (datetime.now) on every
+insert and update. Move them to column defaults, matching the jobs
+table from 001: CURRENT_TIMESTAMP, plus ON UPDATE CURRENT_TIMESTAMP
+for updated_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+# table -> has updated_at
+TIMESTAMPED_TABLES = {
+    'skill_categories': True,
+    'skills_dictionary': True,
+    'skill_aliases': False,
+    'skill_validation_history': False,
+    'validation_queue': True,
+}
+
+
+def upgrade():
+    """Add server-side timestamp defaults"""
+    
+    for table, has_updated_at in TIMESTAMPED_TABLES.items():
+        op.alter_column(
+            table, 'created_at',
+            existing_type=sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP')
+        )
+        if has_updated_at:
+            op.alter_column(
+                table, 'updated_at',
+                existing_type=sa.DateTime(),
+                server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')
+            )
+
+
+def downgrade():
+    """Drop server-side timestamp defaults"""
+    
+    for table, has_updated_at in TIMESTAMPED_TABLES.items():
+        op.alter_column(
+            table, 'created_at',
+            existing_type=sa.DateTime(),
+            server_default=None
+        )
+        if has_updated_at:
+            op.alter_column(
+                table, 'updated_at',
+                existing_type=sa.DateTime(),
+                server_default=None
+            )
@@ -0,0 +1,49 @@
+# Location: backend/alembic/versions/020_add_normalized_alias.py
+"""add normalized_alias to skill_aliases
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-12-17 13:00:00.000000
+
+Module #5: Skill Validation System
+Stores alias.lower().strip() so lookups compare against an indexed
+column instead of LOWER(alias). Adds a B-tree index for exact/prefix
+matches and an InnoDB FULLTEXT index with the ngram parser for fuzzy
+matches (MATCH(normalized_alias) AGAINST (:q)).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add and backfill normalized_alias"""
+    
+    op.add_column(
+        'skill_aliases',
+        sa.Column('normalized_alias', sa.String(100), nullable=True)
+    )
+    op.execute("UPDATE skill_aliases SET normalized_alias = LOWER(TRIM(alias))")
+    op.alter_column(
+        'skill_aliases', 'normalized_alias',
+        existing_type=sa.String(100),
+        nullable=False
+    )
+    
+    op.create_index('idx_normalized_alias', 'skill_aliases', ['normalized_alias'])
+    op.execute(
+        "CREATE FULLTEXT INDEX idx_alias_ngram ON skill_aliases (normalized_alias) WITH PARSER ngram"
+    )
+
+
+def downgrade():
+    """Drop normalized_alias"""
+    
+    op.drop_index('idx_alias_ngram', 'skill_aliases')
+    op.drop_index('idx_normalized_alias', 'skill_aliases')
+    op.drop_column('skill_aliases', 'normalized_alias')
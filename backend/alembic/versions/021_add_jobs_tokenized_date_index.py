@@ -0,0 +1,34 @@
+# Location: backend/alembic/versions/021_add_jobs_tokenized_date_index.py
+"""add (is_tokenized, tanggal_posting) index to jobs
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-12-17 14:00:00.000000
+
+Module #4: Skills Demand Analysis
+Skills analytics read WHERE is_tokenized = TRUE, optionally with a
+tanggal_posting range. A composite index serves both as one range scan
+instead of a full table scan. MySQL has no INCLUDE or partial indexes,
+and tokens (JSON) cannot be an index column, so rows are still read
+from the clustered index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add (is_tokenized, tanggal_posting) index"""
+    
+    op.create_index('idx_jobs_tok_date', 'jobs', ['is_tokenized', 'tanggal_posting'])
+
+
+def downgrade():
+    """Drop (is_tokenized, tanggal_posting) index"""
+    
+    op.drop_index('idx_jobs_tok_date', 'jobs')
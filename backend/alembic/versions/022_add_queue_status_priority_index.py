@@ -0,0 +1,38 @@
+# Location: backend/alembic/versions/022_add_queue_status_priority_index.py
+"""add (status, priority DESC, source_count DESC) index to validation_queue
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-12-17 15:00:00.000000
+
+Module #5: Skill Validation System
+The review queue is read as WHERE status = ? ORDER BY priority DESC,
+source_count DESC (get_next_item, and the default get_queue_items
+sort). A composite index in that order lets MySQL read rows already
+sorted and stop at the LIMIT instead of filesorting every pending row.
+skill_name is already unique (018), so no index is needed for upserts.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add (status, priority DESC, source_count DESC) index"""
+    
+    op.create_index(
+        'idx_queue_status_priority',
+        'validation_queue',
+        ['status', sa.text('priority DESC'), sa.text('source_count DESC')]
+    )
+
+
+def downgrade():
+    """Drop (status, priority DESC, source_count DESC) index"""
+    
+    op.drop_index('idx_queue_status_priority', 'validation_queue')
@@ -199,16 +199,14 @@ async def get_top_skills(
             skills = get_top_skills_by_category(db, category=category, n=n)
         else:
             service = SkillDemandService(db)
-            jobs_data = service.extract_skills_from_jobs()
             
-            if not jobs_data:
+            if not service.load_frequency():
                 return {
                     "success": False,
                     "error": "No tokenized jobs found",
                     "data": {"count": 0, "skills": []}
                 }
             
-            service.analyze_frequency(jobs_data)
             skills = service.get_top_skills(n=n)
         
         return {
@@ -339,23 +337,19 @@ async def get_skill_cooccurrence(
     """
     try:
         service = SkillDemandService(db)
-        jobs_data = service.extract_skills_from_jobs()
         
-        if not jobs_data:
+        if not service.load_frequency(track_pairs=True):
             return {
                 "success": False,
                 "error": "No tokenized jobs found",
                 "data": {"total_pairs": 0, "pairs": []}
             }
         
-        service.analyze_frequency(jobs_data)
-        cooccurrence_results = service.analyze_cooccurrence(
-            jobs_data,
-            min_support=min_support
+        cooccurrence_results = service.load_cooccurrence(
+            min_support=min_support,
+            max_pairs=limit
         )
-        
-        # Limit results
-        pairs = cooccurrence_results['pairs'][:limit]
+        pairs = cooccurrence_results['pairs']
         
         return {
             "success": True,
@@ -21,6 +21,11 @@ from app.schemas.skill_category import (
     SkillCategoryList
 )
 from app.models.skill_category import SkillCategory as SkillCategoryModel
+from app.services.validation.lookup_cache import (
+    get_all_categories,
+    get_category_by_id,
+    get_category_by_name
+)
 
 router = APIRouter()
 
@@ -37,16 +42,11 @@ async def get_categories(
     """
     
     try:
-        query = db.query(SkillCategoryModel)
-        
-        if is_active is not None:
-            query = query.filter(SkillCategoryModel.is_active == is_active)
-        
-        categories = query.order_by(SkillCategoryModel.sort_order).all()
+        categories = get_all_categories(db, is_active=is_active)
         
         return SkillCategoryList(
             total=len(categories),
-            categories=[cat.to_dict() for cat in categories]
+            categories=categories
         )
     
     except Exception as e:
@@ -65,9 +65,7 @@ async def get_category(
     Get single category by ID
     """
     
-    category = db.query(SkillCategoryModel).filter(
-        SkillCategoryModel.id == category_id
-    ).first()
+    category = get_category_by_id(db, category_id)
     
     if not category:
         raise HTTPException(
@@ -75,7 +73,7 @@ async def get_category(
             detail=f"Category {category_id} not found"
         )
     
-    return category.to_dict()
+    return category
 
 
 @router.get("/name/{category_name}", response_model=SkillCategory)
@@ -87,9 +85,7 @@ async def get_category_by_name(
     Get category by name
     """
     
-    category = db.query(SkillCategoryModel).filter(
-        SkillCategoryModel.category_name == category_name
-    ).first()
+    category = get_category_by_name(db, category_name)
     
     if not category:
         raise HTTPException(
@@ -97,7 +93,7 @@ async def get_category_by_name(
             detail=f"Category '{category_name}' not found"
         )
     
-    return category.to_dict()
+    return category
 
 
 @router.post("/", response_model=SkillCategory)
@@ -168,9 +164,6 @@ async def update_category(
         for field, value in update_data.items():
             setattr(category, field, value)
         
-        from datetime import datetime
-        category.updated_at = datetime.now()
-        
         db.commit()
         db.refresh(category)
         
@@ -208,8 +201,6 @@ async def delete_category(
         
         # Soft delete
         category.is_active = False
-        from datetime import datetime
-        category.updated_at = datetime.now()
         
         db.commit()
         
@@ -24,8 +24,8 @@ from app.schemas.skill_dictionary import (
     ValidationStatus
 )
 from app.models.skill_dictionary import SkillsDictionary as SkillsDictionaryModel
-from app.models.skill_category import SkillCategory
 from app.services.validation.skill_validator import SkillValidatorService
+from app.services.validation.lookup_cache import get_skill_by_id, get_category_by_id
 
 router = APIRouter()
 
@@ -113,28 +113,22 @@ async def get_skill(
     Get single skill by ID with category details
     """
     
-    skill = db.query(SkillsDictionaryModel).filter(
-        SkillsDictionaryModel.id == skill_id
-    ).first()
+    skill_dict = get_skill_by_id(db, skill_id)
     
-    if not skill:
+    if not skill_dict:
         raise HTTPException(
             status_code=404,
             detail=f"Skill {skill_id} not found"
         )
     
     # Get category if exists
-    skill_dict = skill.to_dict()
-    
-    if skill.category_id:
-        category = db.query(SkillCategory).filter(
-            SkillCategory.id == skill.category_id
-        ).first()
+    if skill_dict['category_id']:
+        category = get_category_by_id(db, skill_dict['category_id'])
         
         if category:
-            skill_dict['category_name'] = category.category_name
-            skill_dict['category_display_name'] = category.display_name
-            skill_dict['category_icon'] = category.icon
+            skill_dict['category_name'] = category['category_name']
+            skill_dict['category_display_name'] = category['display_name']
+            skill_dict['category_icon'] = category['icon']
     
     return skill_dict
 
@@ -215,8 +209,6 @@ async def update_skill(
         for field, value in update_data.items():
             setattr(skill, field, value)
         
-        skill.updated_at = datetime.now()
-        
         # If category changed, log to history
         if 'category_id' in update_data and update_data['category_id'] != old_category:
             validator = SkillValidatorService(db)
@@ -267,11 +259,9 @@ async def delete_skill(
         
         # Soft delete
         skill.is_active = False
-        skill.updated_at = datetime.now()
         
         # Log to history
         from app.models.validation_history import ValidationHistory
-        from datetime import datetime
         
         history = ValidationHistory(
             skill_id=skill_id,
@@ -1,13 +1,35 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 from app.config import settings 
 from app.api.v1.endpoints import jobs, job_listings, analytics, validation, skills_dictionary, skill_categories
+from app.schemas import job, job_listing, skill_category, skill_dictionary, validation_queue, validation_history
+from app.services.validation.history_writer import history_writer
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schemas use defer_build; compile them here instead of on first request
+    for module in (job, job_listing, skill_category, skill_dictionary, validation_queue, validation_history):
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj.__module__ == module.__name__:
+                obj.model_rebuild()
+
+    # Validation history is written in batches off the request path
+    history_writer.start()
+    try:
+        yield
+    finally:
+        # Flush queued history rows before the process exits
+        await history_writer.stop()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
-    description="API untuk analisis lowongan pekerjaan menggunakan NLP"
+    description="API untuk analisis lowongan pekerjaan menggunakan NLP",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, func, text, FetchedValue
 from app.database.base import Base
-from datetime import datetime
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -14,5 +13,9 @@ class Job(Base):
     salary_max = Column(Float, nullable=True)
     job_type = Column(String(50))
     experience_level = Column(String(50))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(
+        DateTime,
+        server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+        server_onupdate=FetchedValue()
+    )
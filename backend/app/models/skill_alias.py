@@ -7,8 +7,7 @@ Author: Herlambang Haryo Putro
 Date: 2025-12-16
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index, event, func
 from app.database.base import Base
 
 
@@ -16,6 +15,15 @@ class SkillAlias(Base):
     """Skill variations and synonyms"""
     
     __tablename__ = 'skill_aliases'
+    __table_args__ = (
+        Index('idx_normalized_alias', 'normalized_alias'),
+        # n-gram full-text index for fuzzy alias lookup (MATCH ... AGAINST)
+        Index(
+            'idx_alias_ngram', 'normalized_alias',
+            mysql_prefix='FULLTEXT',
+            mysql_with_parser='ngram'
+        ),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -23,6 +31,7 @@ class SkillAlias(Base):
     # Core fields
     skill_id = Column(Integer, nullable=False, index=True)
     alias = Column(String(100), unique=True, nullable=False, index=True)
+    normalized_alias = Column(String(100), nullable=False)  # alias.lower().strip()
     
     # Metadata
     language = Column(String(5), default='id')
@@ -32,7 +41,7 @@ class SkillAlias(Base):
     )
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=func.now())
     
     def __repr__(self):
         return f"<SkillAlias(id={self.id}, alias='{self.alias}', skill_id={self.skill_id})>"
@@ -43,7 +52,16 @@ class SkillAlias(Base):
             'id': self.id,
             'skill_id': self.skill_id,
             'alias': self.alias,
+            'normalized_alias': self.normalized_alias,
             'language': self.language,
             'alias_type': self.alias_type,
             'created_at': self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+        }
+
+
+@event.listens_for(SkillAlias, 'before_insert')
+@event.listens_for(SkillAlias, 'before_update')
+def _normalize_alias(mapper, connection, target):
+    """Keep normalized_alias in sync with alias"""
+    if target.alias is not None:
+        target.normalized_alias = target.alias.lower().strip()
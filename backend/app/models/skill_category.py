@@ -7,9 +7,8 @@ Author: Herlambang Haryo Putro
 Date: 2025-12-16
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func, text, FetchedValue
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database.base import Base
 
 
@@ -38,8 +37,12 @@ class SkillCategory(Base):
     is_active = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(
+        DateTime,
+        server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+        server_onupdate=FetchedValue()
+    )
     
     def __repr__(self):
         return f"<SkillCategory(id={self.id}, name='{self.category_name}')>"
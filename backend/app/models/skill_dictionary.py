@@ -7,9 +7,8 @@ Author: Herlambang Haryo Putro
 Date: 2025-12-16
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Numeric, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Numeric, Enum, JSON, func, text, FetchedValue
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database.base import Base
 
 
@@ -45,8 +44,12 @@ class SkillsDictionary(Base):
     skill_metadata = Column('metadata', JSON)  # Renamed to avoid SQLAlchemy reserved name
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(
+        DateTime,
+        server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+        server_onupdate=FetchedValue()
+    )
     
     def __repr__(self):
         return f"<SkillsDictionary(id={self.id}, skill='{self.skill_name}', status='{self.validation_status}')>"
@@ -7,8 +7,7 @@ Author: Herlambang Haryo Putro
 Date: 2025-12-16
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, JSON
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, JSON, func
 from app.database.base import Base
 
 
@@ -42,7 +41,7 @@ class ValidationHistory(Base):
     history_metadata = Column('metadata', JSON)  # Renamed to avoid SQLAlchemy reserved name
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.now, index=True)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
     
     def __repr__(self):
         return f"<ValidationHistory(id={self.id}, skill_id={self.skill_id}, action='{self.action}')>"
@@ -7,8 +7,7 @@ Author: Herlambang Haryo Putro
 Date: 2025-12-16
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, Enum, JSON
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Enum, JSON, Index, UniqueConstraint, func, text, FetchedValue
 from app.database.base import Base
 
 
@@ -16,12 +15,18 @@ class ValidationQueue(Base):
     """Queue of skills awaiting validation"""
     
     __tablename__ = 'validation_queue'
+    __table_args__ = (
+        # Upsert key for add_to_queue; also serves skill_name lookups
+        UniqueConstraint('skill_name', name='uq_queue_skill_name'),
+        # Serves status filters ordered by priority, source_count (next item / queue list)
+        Index('idx_queue_status_priority', 'status', text('priority DESC'), text('source_count DESC')),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
     
     # Core fields
-    skill_name = Column(String(100), nullable=False, index=True)
+    skill_name = Column(String(100), nullable=False)
     source_count = Column(Integer, default=1)
     priority = Column(Integer, default=0, index=True)
     
@@ -42,8 +47,12 @@ class ValidationQueue(Base):
     queue_metadata = Column('metadata', JSON)  # Renamed to avoid SQLAlchemy reserved name
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(
+        DateTime,
+        server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+        server_onupdate=FetchedValue()
+    )
     completed_at = Column(DateTime)
     
     def __repr__(self):
@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
 class JobBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     title: str
     description: str
     company: str
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import Optional
 from datetime import datetime
 
 class JobListingBase(BaseModel):
     """Base schema untuk JobListing"""
+    model_config = ConfigDict(defer_build=True)
+    
     judul: str = Field(..., description="Judul/posisi pekerjaan")
     perusahaan: str = Field(..., description="Nama perusahaan")
     lokasi: Optional[str] = Field(None, description="Lokasi singkat")
@@ -31,6 +33,8 @@ class JobListingCreate(JobListingBase):
 
 class JobListingUpdate(BaseModel):
     """Schema untuk update job listing (semua field optional)"""
+    model_config = ConfigDict(defer_build=True)
+    
     judul: Optional[str] = None
     perusahaan: Optional[str] = None
     lokasi: Optional[str] = None
@@ -58,11 +62,13 @@ class JobListing(JobListingBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    # Response-only: immutable once built
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class JobListingList(BaseModel):
     """Schema untuk response list job listings dengan pagination"""
+    model_config = ConfigDict(defer_build=True)
+    
     total: int
     page: int
     page_size: int
@@ -70,6 +76,8 @@ class JobListingList(BaseModel):
 
 class JobListingFilter(BaseModel):
     """Schema untuk filtering job listings"""
+    model_config = ConfigDict(defer_build=True)
+    
     judul: Optional[str] = Field(None, description="Filter berdasarkan judul")
     perusahaan: Optional[str] = Field(None, description="Filter berdasarkan perusahaan")
     lokasi: Optional[str] = Field(None, description="Filter berdasarkan lokasi")
@@ -81,6 +89,8 @@ class JobListingFilter(BaseModel):
 
 class JobListingStats(BaseModel):
     """Schema untuk statistik job listings"""
+    model_config = ConfigDict(defer_build=True)
+    
     total_jobs: int
     total_companies: int
     total_locations: int
@@ -7,13 +7,15 @@ Pydantic schemas for request/response validation
 Date: 2025-12-16
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
 
 class SkillCategoryBase(BaseModel):
     """Base schema for skill category"""
+    model_config = ConfigDict(defer_build=True)
+    
     category_name: str = Field(..., max_length=50)
     display_name: Optional[str] = Field(None, max_length=100)
     description: Optional[str] = None
@@ -31,6 +33,8 @@ class SkillCategoryCreate(SkillCategoryBase):
 
 class SkillCategoryUpdate(BaseModel):
     """Schema for updating skill category"""
+    model_config = ConfigDict(defer_build=True)
+    
     display_name: Optional[str] = None
     description: Optional[str] = None
     icon: Optional[str] = None
@@ -52,5 +56,7 @@ class SkillCategory(SkillCategoryBase):
 
 class SkillCategoryList(BaseModel):
     """Schema for list of categories"""
+    model_config = ConfigDict(defer_build=True)
+    
     total: int
     categories: list[SkillCategory]
\ No newline at end of file
@@ -5,7 +5,7 @@ Module #5: Skill Validation System
 Date: 2025-12-16
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -20,6 +20,8 @@ class ValidationStatus(str, Enum):
 
 class SkillsDictionaryBase(BaseModel):
     """Base schema for skills dictionary"""
+    model_config = ConfigDict(defer_build=True)
+    
     skill_name: str = Field(..., max_length=100)
     normalized_name: str = Field(..., max_length=100)
     category_id: Optional[int] = None
@@ -37,6 +39,8 @@ class SkillsDictionaryCreate(SkillsDictionaryBase):
 
 class SkillsDictionaryUpdate(BaseModel):
     """Schema for updating skill in dictionary"""
+    model_config = ConfigDict(defer_build=True)
+    
     normalized_name: Optional[str] = None
     category_id: Optional[int] = None
     subcategory: Optional[str] = None
@@ -60,8 +64,8 @@ class SkillsDictionary(SkillsDictionaryBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    # Response-only: immutable once built
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SkillsDictionaryWithCategory(SkillsDictionary):
@@ -73,6 +77,8 @@ class SkillsDictionaryWithCategory(SkillsDictionary):
 
 class SkillsDictionaryList(BaseModel):
     """Schema for list of skills"""
+    model_config = ConfigDict(defer_build=True)
+    
     total: int
     validated: int
     pending: int
@@ -7,7 +7,7 @@ Author: Arya
 Date: 2025-12-16
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -25,6 +25,8 @@ class HistoryAction(str, Enum):
 
 class ValidationHistoryBase(BaseModel):
     """Base schema for validation history"""
+    model_config = ConfigDict(defer_build=True)
+    
     skill_id: int
     validator_user: Optional[str] = None
     action: HistoryAction
@@ -50,8 +52,8 @@ class ValidationHistory(ValidationHistoryBase):
     metadata: Optional[dict[str, Any]] = None
     created_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    # Response-only: immutable once built
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ValidationHistoryWithDetails(ValidationHistory):
@@ -63,12 +65,16 @@ class ValidationHistoryWithDetails(ValidationHistory):
 
 class ValidationHistoryList(BaseModel):
     """Schema for list of history entries"""
+    model_config = ConfigDict(defer_build=True)
+    
     total: int
     entries: list[ValidationHistory]
 
 
 class ValidationStatsResponse(BaseModel):
     """Schema for validation statistics"""
+    model_config = ConfigDict(defer_build=True)
+    
     total_skills: int
     validated: int
     pending: int
@@ -5,7 +5,7 @@ Module #5: Skill Validation System
 Date: 2025-12-16
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -28,6 +28,8 @@ class ValidationAction(str, Enum):
 
 class ValidationQueueBase(BaseModel):
     """Base schema for validation queue"""
+    model_config = ConfigDict(defer_build=True)
+    
     skill_name: str = Field(..., max_length=100)
     source_count: int = 1
     priority: int = 0
@@ -43,6 +45,8 @@ class ValidationQueueCreate(ValidationQueueBase):
 
 class ValidationQueueUpdate(BaseModel):
     """Schema for updating queue item"""
+    model_config = ConfigDict(defer_build=True)
+    
     status: Optional[QueueStatus] = None
     assigned_to: Optional[str] = None
     suggested_category_id: Optional[int] = None
@@ -62,8 +66,8 @@ class ValidationQueue(ValidationQueueBase):
     updated_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    # Response-only: immutable once built
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ValidationQueueWithCategory(ValidationQueue):
@@ -74,6 +78,8 @@ class ValidationQueueWithCategory(ValidationQueue):
 
 class ValidationQueueList(BaseModel):
     """Schema for list of queue items"""
+    model_config = ConfigDict(defer_build=True)
+    
     total: int
     pending: int
     in_progress: int
@@ -84,6 +90,8 @@ class ValidationQueueList(BaseModel):
 
 class ValidateSkillRequest(BaseModel):
     """Schema for skill validation request"""
+    model_config = ConfigDict(defer_build=True)
+    
     action: ValidationAction
     category_id: Optional[int] = None
     notes: Optional[str] = None
@@ -92,6 +100,8 @@ class ValidateSkillRequest(BaseModel):
 
 class ValidateSkillResponse(BaseModel):
     """Schema for validation response"""
+    model_config = ConfigDict(defer_build=True)
+    
     success: bool
     message: str
     skill_id: Optional[int] = None
@@ -101,6 +111,8 @@ class ValidateSkillResponse(BaseModel):
 
 class BulkValidateRequest(BaseModel):
     """Schema for bulk validation"""
+    model_config = ConfigDict(defer_build=True)
+    
     queue_ids: list[int] = Field(..., min_items=1, max_items=100)
     action: ValidationAction
     category_id: Optional[int] = None
@@ -109,6 +121,8 @@ class BulkValidateRequest(BaseModel):
 
 class BulkValidateResponse(BaseModel):
     """Schema for bulk validation response"""
+    model_config = ConfigDict(defer_build=True)
+    
     success: bool
     total: int
     succeeded: int
@@ -0,0 +1,61 @@
+# Location: backend/app/services/analytics/sketch.py
+"""
+Count-Min Sketch
+Module #4: Skills Demand Analysis
+
+Fixed-memory frequency estimator used to pre-filter skill pairs
+before exact co-occurrence counting. Estimates never undercount,
+so every item with a true count >= threshold survives the filter.
+
+Items are added as 64-bit integer hashes in numpy batches.
+
+Author: Arya
+Date: 2025-12-16
+"""
+
+import numpy as np
+
+
+class CountMinSketch:
+    """Count-Min Sketch over 64-bit item hashes"""
+
+    def __init__(self, width: int = 1 << 18, depth: int = 4, seed: int = 42):
+        """
+        Initialize sketch
+
+        Args:
+            width: Counters per row (memory is width * depth * 4 bytes)
+            depth: Number of hash rows
+            seed: Seed for the per-row hash parameters
+        """
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int32)
+
+        # Odd multipliers + offsets for multiply-shift hashing per row
+        rng = np.random.default_rng(seed)
+        self._mult = rng.integers(1, 2**63, size=depth, dtype=np.uint64) | np.uint64(1)
+        self._add = rng.integers(0, 2**63, size=depth, dtype=np.uint64)
+        self._rows = np.arange(depth)[:, None]
+
+    def _indexes(self, hashes: np.ndarray) -> np.ndarray:
+        """Column index per row, shape (depth, len(hashes))"""
+        keys = np.asarray(hashes, dtype=np.int64).view(np.uint64)
+        mixed = keys[None, :] * self._mult[:, None] + self._add[:, None]
+        return ((mixed >> np.uint64(32)) % np.uint64(self.width)).astype(np.int64)
+
+    def add(self, hashes: np.ndarray):
+        """Count each hash once"""
+        if len(hashes) == 0:
+            return
+
+        cols = self._indexes(hashes)
+        np.add.at(self.table, (np.broadcast_to(self._rows, cols.shape), cols), 1)
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        """Estimated count per hash (never below the true count)"""
+        if len(hashes) == 0:
+            return np.zeros(0, dtype=np.int32)
+
+        cols = self._indexes(hashes)
+        return self.table[self._rows, cols].min(axis=0)
@@ -16,25 +16,406 @@ Author: Arya
 Date: 2025-12-16 (Updated)
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
+import functools
+import heapq
 import json
+import sys
 from sqlalchemy.orm import Session
 from sqlalchemy import text, func
+from pymysql.cursors import SSCursor
+import numpy as np
+
+from app.services.analytics.sketch import CountMinSketch
+
+try:
+    # orjson is several times faster than stdlib json for the tokens column;
+    # its JSONDecodeError subclasses json.JSONDecodeError
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Whether jobs.tokens is a native JSON column (checked once per process)
+_TOKENS_IS_JSON: Optional[bool] = None
+
+
+# Keyword substrings per category, in match priority order
+CATEGORY_KEYWORDS = {
+    'programming_language': ['python', 'java', 'javascript', 'php', 'c++', 'ruby', 'go', 'kotlin', 'swift'],
+    'frontend': ['react', 'vue', 'angular', 'html', 'css', 'frontend'],
+    'backend': ['django', 'flask', 'spring', 'node', 'express', 'backend'],
+    'database': ['mysql', 'postgresql', 'mongodb', 'redis', 'sql', 'database'],
+    'devops': ['docker', 'kubernetes', 'jenkins', 'ci/cd', 'devops', 'aws', 'azure', 'gcp'],
+    'tools': ['photoshop', 'illustrator', 'figma', 'sketch', 'design'],
+    'soft_skill': ['komunikasi', 'teamwork', 'leadership', 'komunikatif', 'organised'],
+}
+
+
+class _KeywordTrie:
+    """
+    Pure-Python fallback with the subset of the ahocorasick.Automaton
+    API used here (add_word / make_automaton / iter)
+    """
+    
+    def __init__(self):
+        self.root = {}
+    
+    def add_word(self, word: str, value: Any):
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = value
+    
+    def make_automaton(self):
+        pass
+    
+    def iter(self, text: str) -> Iterator[Tuple[int, Any]]:
+        for start in range(len(text)):
+            node = self.root
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                if None in node:
+                    yield end, node[None]
+
+
+_category_matcher = None
+
+@functools.lru_cache(maxsize=None)
+def _pair_indices(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper-triangle (i < j) index arrays for n skills"""
+    return np.triu_indices(n, 1)
+
+
+def _merge_counts(
+    id_arrays: List[np.ndarray],
+    count_arrays: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum counts of equal ids across (ids, counts) arrays; ids come back sorted"""
+    unique_ids, inverse = np.unique(np.concatenate(id_arrays), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(count_arrays), minlength=len(unique_ids))
+    return unique_ids, counts.astype(np.int64)
+
+
+def _get_category_matcher():
+    """Build keyword automaton once; values are (priority, category)"""
+    global _category_matcher
+    
+    if _category_matcher is None:
+        try:
+            import ahocorasick
+            matcher = ahocorasick.Automaton()
+        except ImportError:
+            matcher = _KeywordTrie()
+        
+        # Reverse order so a keyword listed under several categories
+        # keeps the highest-priority one
+        categories = list(CATEGORY_KEYWORDS.items())
+        for priority in reversed(range(len(categories))):
+            category, keywords = categories[priority]
+            for keyword in keywords:
+                matcher.add_word(keyword, (priority, category))
+        
+        matcher.make_automaton()
+        _category_matcher = matcher
+    
+    return _category_matcher
+
+
+@functools.lru_cache(maxsize=16384)
+def _scan_category(skill_lower: str) -> str:
+    """
+    Single pass of the keyword automaton over the skill; when
+    keywords from several categories match, the earliest category
+    in CATEGORY_KEYWORDS wins. Memoized: skill frequencies are
+    heavily skewed, so most calls are cache hits.
+    """
+    best = None
+    for _, (priority, category) in _get_category_matcher().iter(skill_lower):
+        if best is None or priority < best[0]:
+            best = (priority, category)
+            if priority == 0:
+                break
+    
+    return best[1] if best else 'uncategorized'
+
+
+_exact_categories = None
+
+
+def _get_exact_categories() -> Dict[str, str]:
+    """
+    Keyword -> category for skills that are exactly a keyword
+    
+    Built from the scan itself so substring precedence is kept
+    (e.g. 'django' contains 'go' and stays programming_language).
+    """
+    global _exact_categories
+    
+    if _exact_categories is None:
+        _exact_categories = {
+            keyword: _scan_category(keyword)
+            for keywords in CATEGORY_KEYWORDS.values()
+            for keyword in keywords
+        }
+    
+    return _exact_categories
 
 
 class SkillDemandService:
     """Service for analyzing skill demand from job market data"""
     
+    # Rows fetched per round trip when streaming jobs
+    FETCH_SIZE = 2048
+    
+    # Skill pairs hashed per numpy batch in co-occurrence
+    PAIR_BATCH_SIZE = 65536
+    
     def __init__(self, db: Session):
         """Initialize service with database session"""
         self.db = db
         self.skills_frequency = Counter()
-        self.skills_by_category = defaultdict(Counter)
+        self.skills_by_category = Counter()  # (category, skill) -> jobs
+        self._category_skills = defaultdict(list)  # category -> skills, first-seen order
         self.skill_cooccurrence = defaultdict(int)
+        self._skill_ids: Dict[str, int] = {}  # skill -> int id for pair packing
         self.jobs_analyzed = 0
         self.skills_total = 0
+        self._start_ingest()
+    
+    def _build_filters(
+        self,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        location: Optional[str] = None,
+        level: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build extra WHERE conditions and params for the jobs filters
+        
+        is_tokenized + tanggal_posting are served by idx_jobs_tok_date
+        (migration 021). location/level stay substring LIKE matches,
+        which no index can serve; they filter the rows that index returns.
+        """
+        conditions = ""
+        params = {}
+        
+        if date_from:
+            conditions += " AND tanggal_posting >= :date_from"
+            params['date_from'] = date_from
+        
+        if date_to:
+            conditions += " AND tanggal_posting <= :date_to"
+            params['date_to'] = date_to
+        
+        if location:
+            conditions += " AND lokasi LIKE :location"
+            params['location'] = f"%{location}%"
+        
+        if level:
+            conditions += " AND level LIKE :level"
+            params['level'] = f"%{level}%"
+        
+        return conditions, params
+    
+    def _supports_sql_aggregation(self) -> bool:
+        """
+        Check whether jobs.tokens is a native JSON column
+        
+        JSON_TABLE aggregation needs MySQL 8 JSON; plain TEXT
+        columns fall back to parsing in Python. The probe runs on its
+        own connection so a failure leaves the session's transaction
+        alone, and a failed probe is not cached (retried next call).
+        """
+        global _TOKENS_IS_JSON
+        
+        if _TOKENS_IS_JSON is None:
+            try:
+                with self.db.get_bind().connect() as conn:
+                    data_type = conn.execute(text("""
+                        SELECT DATA_TYPE FROM information_schema.COLUMNS
+                        WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = 'jobs'
+                        AND COLUMN_NAME = 'tokens'
+                    """)).scalar()
+            except Exception:
+                # Python path for this call only
+                return False
+            _TOKENS_IS_JSON = (data_type or '').lower() == 'json'
+        
+        return _TOKENS_IS_JSON
+    
+    def _job_skills_cte(self, limit: Optional[int] = None, **filters) -> Tuple[str, Dict[str, Any]]:
+        """
+        CTE with one (job id, normalized skill) row per distinct skill per job
+        
+        Unnests the same tokens.skills shapes as _parse_job_row, with the
+        same precedence: {"top": [...]}, then {"skills": [...]}, then
+        {"categorized": {category: [...]}}, then a bare list. "skills" and
+        bare lists also accept {"normalized": ...} items; non-string names
+        are skipped. Names are LOWER(TRIM()), which strips spaces only -
+        tokenizer output carries no other surrounding whitespace.
+        """
+        conditions, params = self._build_filters(**filters)
+        
+        limit_sql = ""
+        if limit:
+            limit_sql = " LIMIT :limit"
+            params['limit'] = limit
+        
+        cte = f"""
+        WITH filtered_jobs AS (
+            SELECT id, JSON_EXTRACT(tokens, '$.skills') AS skills
+            FROM jobs
+            WHERE is_tokenized = TRUE
+            AND tokens IS NOT NULL{conditions}{limit_sql}
+        ),
+        skill_items AS (
+            SELECT j.id, t.item, FALSE AS allow_object
+            FROM filtered_jobs j,
+            JSON_TABLE(j.skills, '$.top[*]' COLUMNS (item JSON PATH '$')) t
+            WHERE JSON_TYPE(JSON_EXTRACT(j.skills, '$.top')) = 'ARRAY'
+            
+            UNION ALL
+            SELECT j.id, t.item, TRUE
+            FROM filtered_jobs j,
+            JSON_TABLE(j.skills, '$.skills[*]' COLUMNS (item JSON PATH '$')) t
+            WHERE JSON_TYPE(j.skills) = 'OBJECT'
+            AND NOT JSON_CONTAINS_PATH(j.skills, 'one', '$.top')
+            AND JSON_TYPE(JSON_EXTRACT(j.skills, '$.skills')) = 'ARRAY'
+            
+            UNION ALL
+            SELECT j.id, t.item, FALSE
+            FROM filtered_jobs j,
+            JSON_TABLE(j.skills, '$.categorized.*[*]' COLUMNS (item JSON PATH '$')) t
+            WHERE JSON_TYPE(j.skills) = 'OBJECT'
+            AND NOT JSON_CONTAINS_PATH(j.skills, 'one', '$.top', '$.skills')
+            AND JSON_TYPE(JSON_EXTRACT(j.skills, '$.categorized')) = 'OBJECT'
+            
+            UNION ALL
+            SELECT j.id, t.item, TRUE
+            FROM filtered_jobs j,
+            JSON_TABLE(j.skills, '$[*]' COLUMNS (item JSON PATH '$')) t
+            WHERE JSON_TYPE(j.skills) = 'ARRAY'
+        ),
+        skill_names AS (
+            SELECT id, LOWER(TRIM(CASE
+                WHEN JSON_TYPE(item) = 'STRING' THEN JSON_UNQUOTE(item)
+                WHEN allow_object
+                    AND JSON_TYPE(JSON_EXTRACT(item, '$.normalized')) = 'STRING'
+                    THEN JSON_UNQUOTE(JSON_EXTRACT(item, '$.normalized'))
+            END)) AS skill
+            FROM skill_items
+        ),
+        job_skills AS (
+            SELECT DISTINCT id, skill
+            FROM skill_names
+            WHERE skill <> ''
+        )
+        """
+        return cte, params
+    
+    def _frequency_sql(self, limit: Optional[int] = None, **filters) -> Tuple[Counter, int]:
+        """Count jobs per skill in MySQL; returns (skill counts, jobs with skills)"""
+        cte, params = self._job_skills_cte(limit=limit, **filters)
+        
+        rows = self.db.execute(text(cte + """
+            SELECT skill, COUNT(*) AS demand_count
+            FROM job_skills
+            GROUP BY skill
+            ORDER BY demand_count DESC
+        """), params).fetchall()
+        
+        jobs_count = self.db.execute(
+            text(cte + "SELECT COUNT(DISTINCT id) FROM job_skills"), params
+        ).scalar() or 0
+        
+        return Counter(dict(rows)), jobs_count
+    
+    def _cooccurrence_sql(
+        self,
+        min_support: int = 5,
+        limit: Optional[int] = None,
+        **filters
+    ) -> Dict[Tuple[str, str], int]:
+        """Count skill pairs per job in MySQL with a self-join on the unnested skills"""
+        cte, params = self._job_skills_cte(limit=limit, **filters)
+        params['min_support'] = min_support
+        
+        rows = self.db.execute(text(cte + """
+            SELECT a.skill, b.skill, COUNT(*) AS pair_count
+            FROM job_skills a
+            JOIN job_skills b ON a.id = b.id AND a.skill < b.skill
+            GROUP BY a.skill, b.skill
+            HAVING pair_count >= :min_support
+        """), params).fetchall()
+        
+        return {(row[0], row[1]): row[2] for row in rows}
+    
+    def load_frequency(
+        self,
+        limit: Optional[int] = None,
+        track_pairs: bool = False,
+        **filters
+    ) -> int:
+        """
+        Populate skills_frequency and jobs_analyzed
+        
+        Aggregates in MySQL when tokens is a JSON column, otherwise
+        extracts and counts in Python. Category breakdown
+        (skills_by_category) is only filled by the Python path.
+        
+        Args:
+            limit: Maximum jobs to analyze
+            track_pairs: On the Python path, keep per-job skill ids so a
+                following load_cooccurrence() with the same filters
+                reuses this pass instead of reading the jobs again
+        
+        Returns:
+            Number of jobs with skills
+        """
+        if self._supports_sql_aggregation():
+            self.skills_frequency, self.jobs_analyzed = self._frequency_sql(limit=limit, **filters)
+        else:
+            self._start_ingest(track_pairs=track_pairs)
+            for job in self.iter_jobs(limit=limit, **filters):
+                self.ingest(job)
+            if track_pairs:
+                self._pairs_key = (limit, sorted(filters.items()))
+        
+        self.skills_total = len(self.skills_frequency)
+        
+        return self.jobs_analyzed
+    
+    def load_cooccurrence(
+        self,
+        min_support: int = 5,
+        limit: Optional[int] = None,
+        max_pairs: Optional[int] = None,
+        **filters
+    ) -> Dict[str, Any]:
+        """
+        Skill co-occurrence, aggregated in MySQL when possible
+        
+        Call load_frequency() first with the same filters; pass it
+        track_pairs=True so the Python path reuses that pass.
+        """
+        if self._supports_sql_aggregation():
+            cooccurrence = self._cooccurrence_sql(min_support=min_support, limit=limit, **filters)
+            return self._format_cooccurrence(cooccurrence, min_support, max_pairs=max_pairs)
+        
+        if self._jobs_skill_ids is not None and self._pairs_key == (limit, sorted(filters.items())):
+            jobs_skill_ids, self._jobs_skill_ids = self._jobs_skill_ids, None
+            return self._cooccurrence_from_ids(jobs_skill_ids, min_support, max_pairs=max_pairs)
+        
+        jobs_data = self.extract_skills_from_jobs(limit=limit, **filters)
+        return self.analyze_cooccurrence(jobs_data, min_support=min_support, max_pairs=max_pairs)
     
     def extract_skills_from_jobs(
         self,
@@ -49,172 +430,266 @@ class SkillDemandService:
         
         UPDATED: Handles actual token format with skills.top array
         """
+        return list(self.iter_jobs(
+            limit=limit,
+            date_from=date_from,
+            date_to=date_to,
+            location=location,
+            level=level
+        ))
+    
+    def iter_jobs(
+        self,
+        limit: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        location: Optional[str] = None,
+        level: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream jobs with skills from database
+        
+        Same filters as extract_skills_from_jobs, but yields one job at
+        a time so memory stays flat regardless of limit.
+        """
+        # Only ship tokens.skills when MySQL can project it; a TEXT
+        # column may hold invalid JSON, so it is parsed in Python
+        skills_only = self._supports_sql_aggregation()
+        tokens_column = "JSON_EXTRACT(tokens, '$.skills')" if skills_only else "tokens"
+        
         # Build query
-        query = """
+        query = f"""
         SELECT 
             id,
             judul,
             perusahaan,
             lokasi,
             level,
-            tokens,
-            tanggal_posting,
-            is_tokenized
+            {tokens_column},
+            tanggal_posting
         FROM jobs
         WHERE is_tokenized = TRUE
         AND tokens IS NOT NULL
         """
         
-        params = {}
-        
         # Add filters
-        if date_from:
-            query += " AND tanggal_posting >= :date_from"
-            params['date_from'] = date_from
-        
-        if date_to:
-            query += " AND tanggal_posting <= :date_to"
-            params['date_to'] = date_to
+        conditions, params = self._build_filters(
+            date_from=date_from,
+            date_to=date_to,
+            location=location,
+            level=level
+        )
+        query += conditions
         
-        if location:
-            query += " AND lokasi LIKE :location"
-            params['location'] = f"%{location}%"
+        # Add limit (bound, not interpolated)
+        if limit:
+            query += " LIMIT :limit"
+            params['limit'] = int(limit)
         
-        if level:
-            query += " AND level LIKE :level"
-            params['level'] = f"%{level}%"
+        # Execute on the raw DBAPI connection with a server-side cursor:
+        # rows stream in FETCH_SIZE batches and skip SQLAlchemy's
+        # result processing
+        compiled = text(query).bindparams(**params).compile(
+            dialect=self.db.get_bind().dialect
+        )
+        cursor = self.db.connection().connection.cursor(SSCursor)
         
-        # Add limit
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        # Execute query
-        result = self.db.execute(text(query), params)
-        rows = result.fetchall()
-        
-        # Parse skills from tokens JSON
-        jobs_with_skills = []
-        
-        for row in rows:
-            job_data = {
-                'id': row[0],
-                'title': row[1],
-                'company': row[2],
-                'location': row[3],
-                'level': row[4],
-                'posting_date': row[6],
-                'skills': []
-            }
+        try:
+            # pymysql compiles to positional %s placeholders
+            cursor.execute(
+                str(compiled),
+                tuple(compiled.params[name] for name in compiled.positiontup or ())
+            )
             
-            # Parse tokens JSON
-            if row[5]:  # tokens column
-                try:
-                    tokens = json.loads(row[5]) if isinstance(row[5], str) else row[5]
+            while True:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+                if not rows:
+                    break
+                
+                for row in rows:
+                    job_data = self._parse_job_row(row, skills_only=skills_only)
                     
-                    # ===== UPDATED: Handle actual token format =====
-                    if 'skills' in tokens:
-                        skills_data = tokens['skills']
-                        
-                        if isinstance(skills_data, dict):
-                            # Format 1: {"top": [...], "categories": [...]}
-                            if 'top' in skills_data:
-                                top_skills = skills_data['top']
-                                categories = skills_data.get('categories', [])
-                                
-                                # Convert to expected format
-                                if isinstance(top_skills, list):
-                                    for skill in top_skills:
-                                        if skill:  # Skip empty strings
-                                            # Try to match category
-                                            category = 'uncategorized'
-                                            if categories and len(categories) > 0:
-                                                category = categories[0] if len(categories) == 1 else self._infer_category(skill)
-                                            
-                                            job_data['skills'].append({
-                                                'normalized': skill.lower().strip(),
-                                                'category': category
-                                            })
-                            
-                            # Format 2: Old format with nested 'skills' key
-                            elif 'skills' in skills_data:
-                                skill_list = skills_data['skills']
-                                if isinstance(skill_list, list):
-                                    job_data['skills'] = skill_list
+                    # Only include jobs with skills
+                    if job_data and job_data['skills']:
+                        yield job_data
+        finally:
+            cursor.close()
+    
+    def _parse_job_row(self, row: Tuple, skills_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Build job dict from a jobs row, parsing skills from tokens JSON
+        
+        Args:
+            row: (id, judul, perusahaan, lokasi, level, tokens, tanggal_posting)
+            skills_only: row[5] is already the tokens.skills subtree
+        
+        Returns None if tokens is invalid
+        """
+        job_data = {
+            'id': row[0],
+            'title': row[1],
+            'company': row[2],
+            'location': row[3],
+            'level': row[4],
+            'posting_date': row[6],
+            'skills': []
+        }
+        
+        # Parse tokens JSON
+        if row[5]:  # tokens column
+            try:
+                tokens = _json_loads(row[5]) if isinstance(row[5], (str, bytes)) else row[5]
+                
+                # ===== UPDATED: Handle actual token format =====
+                if skills_only or 'skills' in tokens:
+                    skills_data = tokens if skills_only else tokens['skills']
+                    
+                    if isinstance(skills_data, dict):
+                        # Format 1: {"top": [...], "categories": [...]}
+                        if 'top' in skills_data:
+                            top_skills = skills_data['top']
+                            categories = skills_data.get('categories', [])
                             
-                            # Format 3: Categorized format
-                            elif 'categorized' in skills_data:
-                                categorized = skills_data['categorized']
-                                for category, skill_list in categorized.items():
-                                    for skill in skill_list:
-                                        job_data['skills'].append({
-                                            'normalized': skill,
-                                            'category': category
-                                        })
+                            # Convert to expected format
+                            if isinstance(top_skills, list):
+                                for skill in top_skills:
+                                    entry = self._skill_entry(skill)
+                                    if entry:  # Skip empty strings
+                                        # Try to match category
+                                        if categories and len(categories) > 0:
+                                            entry['category'] = sys.intern(categories[0]) if len(categories) == 1 else self._infer_category(entry['normalized'])
+                                        
+                                        job_data['skills'].append(entry)
                         
-                        elif isinstance(skills_data, list):
-                            # Direct list of skills
-                            for skill in skills_data:
-                                if isinstance(skill, str):
-                                    job_data['skills'].append({
-                                        'normalized': skill.lower().strip(),
-                                        'category': 'uncategorized'
-                                    })
-                                elif isinstance(skill, dict):
-                                    job_data['skills'].append(skill)
+                        # Format 2: Old format with nested 'skills' key
+                        elif 'skills' in skills_data:
+                            skill_list = skills_data['skills']
+                            if isinstance(skill_list, list):
+                                for skill in skill_list:
+                                    self._append_skill(job_data['skills'], skill)
+                        
+                        # Format 3: Categorized format
+                        elif 'categorized' in skills_data:
+                            categorized = skills_data['categorized']
+                            for category, skill_list in categorized.items():
+                                for skill in skill_list:
+                                    entry = self._skill_entry(skill, category)
+                                    if entry:
+                                        job_data['skills'].append(entry)
                     
-                except (json.JSONDecodeError, TypeError, KeyError) as e:
-                    # Skip jobs with invalid tokens
-                    continue
-            
-            # Only include jobs with skills
-            if job_data['skills']:
-                jobs_with_skills.append(job_data)
+                    elif isinstance(skills_data, list):
+                        # Direct list of skills
+                        for skill in skills_data:
+                            self._append_skill(job_data['skills'], skill)
+                
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                # Skip jobs with invalid tokens
+                return None
         
-        return jobs_with_skills
+        return job_data
     
-    def _infer_category(self, skill: str) -> str:
+    def _skill_entry(
+        self,
+        skill_name: Any,
+        category: Any = 'uncategorized'
+    ) -> Optional[Dict[str, str]]:
         """
-        Infer category from skill name
-        Basic categorization logic
+        Canonical skill dict, or None for empty/non-string names
+        
+        Names are lowercased, stripped and interned here once, so the
+        analyses can use skill_info['normalized'] as-is.
         """
-        skill_lower = skill.lower()
+        if not isinstance(skill_name, str):
+            return None
         
-        # Programming languages
-        prog_langs = ['python', 'java', 'javascript', 'php', 'c++', 'ruby', 'go', 'kotlin', 'swift']
-        if any(lang in skill_lower for lang in prog_langs):
-            return 'programming_language'
+        normalized = skill_name.lower().strip()
+        if not normalized:
+            return None
         
-        # Frontend
-        frontend = ['react', 'vue', 'angular', 'html', 'css', 'frontend']
-        if any(fw in skill_lower for fw in frontend):
-            return 'frontend'
+        return {
+            'normalized': sys.intern(normalized),
+            'category': sys.intern(category) if isinstance(category, str) else category
+        }
+    
+    def _append_skill(self, skills: List[Dict[str, str]], skill_info: Any):
+        """Append a skill given as a plain name or a {'normalized', 'category'} dict"""
+        if isinstance(skill_info, dict):
+            entry = self._skill_entry(
+                skill_info.get('normalized', ''),
+                skill_info.get('category', 'uncategorized')
+            )
+        else:
+            entry = self._skill_entry(skill_info)
+        
+        if entry:
+            skills.append(entry)
+    
+    @staticmethod
+    def _infer_category(skill_lower: str) -> str:
+        """
+        Infer category from lowercased skill name
+        Basic categorization logic
+        
+        Most skills are exactly one of the keywords, so try the
+        precomputed keyword map first and only scan compound names.
+        """
+        category = _get_exact_categories().get(skill_lower)
+        return category if category else _scan_category(skill_lower)
+    
+    def ingest(self, job: Dict[str, Any]):
+        """
+        Add one job to all running analyses
+        
+        Updates skill frequency and category counts, and, when enabled
+        by _start_ingest(), the co-occurrence skill ids and per-period
+        trend counts - so a single pass over the jobs feeds everything.
+        """
+        skill_categories = self._skill_categories
         
-        # Backend
-        backend = ['django', 'flask', 'spring', 'node', 'express', 'backend']
-        if any(fw in skill_lower for fw in backend):
-            return 'backend'
+        # Trend period for this job
+        period_skills = None
+        if self._trend_period:
+            posting_date = job.get('posting_date')
+            if posting_date:
+                period_key = self._period_key(posting_date, self._trend_period)
+                self._period_jobs[period_key] += 1
+                period_skills = self._period_skills[period_key]
         
-        # Databases
-        databases = ['mysql', 'postgresql', 'mongodb', 'redis', 'sql', 'database']
-        if any(db in skill_lower for db in databases):
-            return 'database'
+        # Use set to count each skill once per job
+        job_skills = set()
         
-        # DevOps
-        devops = ['docker', 'kubernetes', 'jenkins', 'ci/cd', 'devops', 'aws', 'azure', 'gcp']
-        if any(tool in skill_lower for tool in devops):
-            return 'devops'
+        for skill_info in job['skills']:
+            skill_name = skill_info['normalized']
+            job_skills.add(skill_name)
+            skill_categories[skill_name] = skill_info['category']
+            
+            if period_skills is not None:
+                period_skills[skill_name] += 1
         
-        # Design tools
-        design = ['photoshop', 'illustrator', 'figma', 'sketch', 'design']
-        if any(tool in skill_lower for tool in design):
-            return 'tools'
+        # Count each skill once per job
+        skills_by_category = self.skills_by_category
+        for skill in job_skills:
+            self.skills_frequency[skill] += 1
+            key = (skill_categories.get(skill, 'uncategorized'), skill)
+            if key not in skills_by_category:
+                self._category_skills[key[0]].append(skill)
+            skills_by_category[key] += 1
         
-        # Soft skills
-        soft = ['komunikasi', 'teamwork', 'leadership', 'komunikatif', 'organised']
-        if any(s in skill_lower for s in soft):
-            return 'soft_skill'
+        self.jobs_analyzed += 1
         
-        return 'uncategorized'
+        if self._jobs_skill_ids is not None:
+            self._jobs_skill_ids.append(self._skill_id_array(job_skills))
+    
+    def _start_ingest(self, track_pairs: bool = False, trend_period: Optional[str] = None):
+        """Reset accumulators used by ingest()"""
+        self.skills_frequency = Counter()
+        self.jobs_analyzed = 0
+        self._skill_categories = {}
+        self._jobs_skill_ids = [] if track_pairs else None
+        self._pairs_key = None  # (limit, filters) the skill ids were built for
+        self._trend_period = trend_period
+        self._period_jobs = Counter()
+        self._period_skills = defaultdict(Counter)
     
     def analyze_frequency(
         self,
@@ -222,38 +697,17 @@ class SkillDemandService:
     ) -> Dict[str, Any]:
         """Analyze skill frequency across all jobs"""
         
-        skill_counts = Counter()
-        skill_categories = {}
-        
+        self._start_ingest()
         for job in jobs_data:
-            # Use set to count each skill once per job
-            job_skills = set()
-            
-            for skill_info in job['skills']:
-                # Extract skill name and category
-                if isinstance(skill_info, dict):
-                    skill_name = skill_info.get('normalized', '')
-                    skill_category = skill_info.get('category', 'uncategorized')
-                elif isinstance(skill_info, str):
-                    skill_name = skill_info
-                    skill_category = 'uncategorized'
-                else:
-                    continue
-                
-                if skill_name:
-                    skill_name = skill_name.lower().strip()
-                    job_skills.add(skill_name)
-                    skill_categories[skill_name] = skill_category
-            
-            # Count each skill once per job
-            for skill in job_skills:
-                skill_counts[skill] += 1
-                category = skill_categories.get(skill, 'uncategorized')
-                self.skills_by_category[category][skill] += 1
-        
-        # Store results
-        self.skills_frequency = skill_counts
-        self.jobs_analyzed = len(jobs_data)
+            self.ingest(job)
+        
+        return self._frequency_results()
+    
+    def _frequency_results(self) -> Dict[str, Any]:
+        """Format frequency analysis from the ingested jobs"""
+        
+        skill_counts = self.skills_frequency
+        skill_categories = self._skill_categories
         self.skills_total = len(skill_counts)
         
         # Format output
@@ -262,14 +716,14 @@ class SkillDemandService:
                 'skill': skill,
                 'demand_count': count,
                 'category': skill_categories.get(skill, 'uncategorized'),
-                'percentage': round(count / len(jobs_data) * 100, 2),
+                'percentage': round(count / self.jobs_analyzed * 100, 2),
                 'rank': rank
             }
             for rank, (skill, count) in enumerate(skill_counts.most_common(), 1)
         ]
         
         return {
-            'total_jobs': len(jobs_data),
+            'total_jobs': self.jobs_analyzed,
             'total_skills': len(skill_counts),
             'skills': frequency_list
         }
@@ -277,54 +731,156 @@ class SkillDemandService:
     def analyze_cooccurrence(
         self,
         jobs_data: List[Dict[str, Any]],
-        min_support: int = 5
+        min_support: int = 5,
+        max_pairs: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Analyze which skills appear together"""
+        """
+        Analyze which skills appear together
         
-        cooccurrence = defaultdict(int)
+        Two passes: a Count-Min Sketch estimates every pair in fixed
+        memory, then only pairs whose estimate reaches min_support are
+        counted exactly. The long tail of rare pairs is never stored.
         
-        for job in jobs_data:
-            # Get unique skills in this job
-            job_skills = set()
-            for skill_info in job['skills']:
-                if isinstance(skill_info, dict):
-                    skill_name = skill_info.get('normalized', '')
-                elif isinstance(skill_info, str):
-                    skill_name = skill_info
-                else:
-                    continue
-                
-                if skill_name:
-                    job_skills.add(skill_name.lower().strip())
+        Skills are interned to int ids once; pairs are packed int64 ids
+        (skill_1 << 32 | skill_2) generated and counted with numpy
+        instead of Python tuples.
+        """
+        # Sorted skill ids per job (computed once, reused by both passes)
+        jobs_skill_ids = [self._job_skill_ids(job) for job in jobs_data]
+        
+        return self._cooccurrence_from_ids(jobs_skill_ids, min_support, max_pairs=max_pairs)
+    
+    def _cooccurrence_from_ids(
+        self,
+        jobs_skill_ids: List[np.ndarray],
+        min_support: int,
+        max_pairs: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Co-occurrence analysis from per-job sorted skill id arrays"""
+        
+        # Pass 1: estimate pair counts
+        sketch = CountMinSketch()
+        for pair_ids in self._pair_id_batches(jobs_skill_ids):
+            sketch.add(pair_ids)
+        
+        # Pass 2: exact counts for candidate pairs. Each batch is reduced
+        # to (distinct id, count) and batches are merged once they add up
+        # to the running totals, so memory follows distinct candidates
+        # rather than their occurrences
+        unique_ids = np.zeros(0, dtype=np.int64)
+        counts = np.zeros(0, dtype=np.int64)
+        pending_ids, pending_counts, pending_size = [], [], 0
+        
+        for pair_ids in self._pair_id_batches(jobs_skill_ids):
+            batch_ids, batch_counts = np.unique(
+                pair_ids[sketch.estimate(pair_ids) >= min_support],
+                return_counts=True
+            )
+            pending_ids.append(batch_ids)
+            pending_counts.append(batch_counts)
+            pending_size += len(batch_ids)
             
-            # Create pairs
-            skills_list = sorted(list(job_skills))
-            for i in range(len(skills_list)):
-                for j in range(i + 1, len(skills_list)):
-                    pair = (skills_list[i], skills_list[j])
-                    cooccurrence[pair] += 1
-        
-        # Filter and format
-        pairs_list = []
-        for pair, count in cooccurrence.items():
-            if count >= min_support:
-                # Calculate lift score
-                skill1_freq = self.skills_frequency.get(pair[0], 1)
-                skill2_freq = self.skills_frequency.get(pair[1], 1)
-                
-                expected = (skill1_freq * skill2_freq) / self.jobs_analyzed
-                lift = count / expected if expected > 0 else 0
-                
-                pairs_list.append({
-                    'skill_1': pair[0],
-                    'skill_2': pair[1],
-                    'cooccurrence_count': count,
-                    'lift': round(lift, 3),
-                    'confidence': round(count / skill1_freq, 3)
-                })
+            if pending_size >= max(len(unique_ids), self.PAIR_BATCH_SIZE):
+                unique_ids, counts = _merge_counts([unique_ids, *pending_ids], [counts, *pending_counts])
+                pending_ids, pending_counts, pending_size = [], [], 0
+        
+        if pending_ids:
+            unique_ids, counts = _merge_counts([unique_ids, *pending_ids], [counts, *pending_counts])
+        
+        cooccurrence = {}
+        if len(unique_ids):
+            id_to_skill = list(self._skill_ids)
+            cooccurrence = {
+                (id_to_skill[pair_id >> 32], id_to_skill[pair_id & 0xFFFFFFFF]): count
+                for pair_id, count in zip(unique_ids.tolist(), counts.tolist())
+            }
+        
+        return self._format_cooccurrence(cooccurrence, min_support, max_pairs=max_pairs)
+    
+    def _job_skill_ids(self, job: Dict[str, Any]) -> np.ndarray:
+        """Ids of the unique skills in one job, in skill name order"""
+        
+        # Get unique skills in this job
+        job_skills = {skill_info['normalized'] for skill_info in job['skills']}
+        
+        return self._skill_id_array(job_skills)
+    
+    def _skill_id_array(self, job_skills: set) -> np.ndarray:
+        """
+        Sorted-by-name id array for a set of skills
+        
+        New skills are added to self._skill_ids
+        """
+        skill_ids = self._skill_ids
+        return np.fromiter(
+            (skill_ids.setdefault(skill, len(skill_ids)) for skill in sorted(job_skills)),
+            dtype=np.int64,
+            count=len(job_skills)
+        )
+    
+    def _pair_id_batches(self, jobs_skill_ids: List[np.ndarray]) -> Iterator[np.ndarray]:
+        """Packed pair ids of all jobs, about PAIR_BATCH_SIZE per batch"""
+        batch, batch_size = [], 0
+        
+        for ids in jobs_skill_ids:
+            n = len(ids)
+            if n < 2:
+                continue
+            
+            # Create pairs (upper triangle of the sorted skill ids)
+            i, j = _pair_indices(n)
+            batch.append((ids[i] << 32) | ids[j])
+            batch_size += len(i)
+            
+            if batch_size >= self.PAIR_BATCH_SIZE:
+                yield np.concatenate(batch)
+                batch, batch_size = [], 0
+        
+        if batch:
+            yield np.concatenate(batch)
+    
+    def _format_cooccurrence(
+        self,
+        cooccurrence: Dict[Tuple[str, str], int],
+        min_support: int,
+        max_pairs: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Filter pairs by min_support and add lift/confidence
+        
+        With max_pairs, only the top pairs are selected (heap, O(P log k))
+        and formatted instead of sorting every pair.
+        """
+        
+        # Filter
+        supported = [
+            (pair, count) for pair, count in cooccurrence.items()
+            if count >= min_support
+        ]
         
         # Sort by co-occurrence count
-        pairs_list.sort(key=lambda x: x['cooccurrence_count'], reverse=True)
+        if max_pairs is not None and max_pairs < len(supported):
+            supported = heapq.nlargest(max_pairs, supported, key=itemgetter(1))
+        else:
+            supported.sort(key=itemgetter(1), reverse=True)
+        
+        # Format
+        pairs_list = []
+        for pair, count in supported:
+            # Calculate lift score
+            skill1_freq = self.skills_frequency.get(pair[0], 1)
+            skill2_freq = self.skills_frequency.get(pair[1], 1)
+            
+            expected = (skill1_freq * skill2_freq) / self.jobs_analyzed
+            lift = count / expected if expected > 0 else 0
+            
+            pairs_list.append({
+                'skill_1': pair[0],
+                'skill_2': pair[1],
+                'cooccurrence_count': count,
+                'lift': round(lift, 3),
+                'confidence': round(count / skill1_freq, 3)
+            })
         
         self.skill_cooccurrence = cooccurrence
         
@@ -341,8 +897,11 @@ class SkillDemandService:
     ) -> List[Dict[str, Any]]:
         """Get top N demanded skills"""
         
-        if category and category in self.skills_by_category:
-            skills_counter = self.skills_by_category[category]
+        if category and category in self._category_skills:
+            skills_counter = Counter({
+                skill: self.skills_by_category[(category, skill)]
+                for skill in self._category_skills[category]
+            })
         else:
             skills_counter = self.skills_frequency
         
@@ -363,9 +922,10 @@ class SkillDemandService:
         
         category_stats = []
         
-        for category, skills_counter in self.skills_by_category.items():
-            total_skills = len(skills_counter)
-            total_demand = sum(skills_counter.values())
+        skills_by_category = self.skills_by_category
+        for category, skills in self._category_skills.items():
+            total_skills = len(skills)
+            total_demand = sum(skills_by_category[(category, skill)] for skill in skills)
             
             category_stats.append({
                 'category': category,
@@ -391,50 +951,53 @@ class SkillDemandService:
         """Analyze skill demand trends over time"""
         
         # Group jobs by period
-        periods = defaultdict(list)
+        period_jobs = Counter()
+        period_skills = defaultdict(Counter)
         
         for job in jobs_data:
             posting_date = job.get('posting_date')
             if not posting_date:
                 continue
             
-            # Determine period key
-            if period == 'day':
-                period_key = posting_date.strftime('%Y-%m-%d')
-            elif period == 'week':
-                period_key = posting_date.strftime('%Y-W%W')
-            else:  # month
-                period_key = posting_date.strftime('%Y-%m')
+            period_key = self._period_key(posting_date, period)
+            period_jobs[period_key] += 1
             
-            periods[period_key].append(job)
+            # Get skills for this period
+            for skill_info in job['skills']:
+                period_skills[period_key][skill_info['normalized']] += 1
+        
+        return self._trend_results(period, period_jobs, period_skills)
+    
+    def _period_key(self, posting_date: datetime, period: str) -> str:
+        """Determine period key"""
+        if period == 'day':
+            return posting_date.strftime('%Y-%m-%d')
+        elif period == 'week':
+            return posting_date.strftime('%Y-W%W')
+        else:  # month
+            return posting_date.strftime('%Y-%m')
+    
+    def _trend_results(
+        self,
+        period: str,
+        period_jobs: Counter,
+        period_skills: Dict[str, Counter]
+    ) -> Dict[str, Any]:
+        """Format per-period job counts and skill counts"""
         
         # Analyze each period
         trends_data = []
         
-        for period_key in sorted(periods.keys()):
-            period_jobs = periods[period_key]
-            
-            # Get skills for this period
-            period_skills = Counter()
-            for job in period_jobs:
-                for skill_info in job['skills']:
-                    if isinstance(skill_info, dict):
-                        skill_name = skill_info.get('normalized', '')
-                    elif isinstance(skill_info, str):
-                        skill_name = skill_info
-                    else:
-                        continue
-                    
-                    if skill_name:
-                        period_skills[skill_name.lower().strip()] += 1
+        for period_key in sorted(period_jobs.keys()):
+            skills = period_skills[period_key]
             
             trends_data.append({
                 'period': period_key,
-                'job_count': len(period_jobs),
-                'unique_skills': len(period_skills),
+                'job_count': period_jobs[period_key],
+                'unique_skills': len(skills),
                 'top_skills': [
                     {'skill': skill, 'count': count}
-                    for skill, count in period_skills.most_common(10)
+                    for skill, count in skills.most_common(10)
                 ]
             })
         
@@ -452,12 +1015,12 @@ class SkillDemandService:
         return {
             'total_jobs_analyzed': self.jobs_analyzed,
             'total_unique_skills': self.skills_total,
-            'total_categories': len(self.skills_by_category),
+            'total_categories': len(self._category_skills),
             'avg_skills_per_job': round(
                 sum(self.skills_frequency.values()) / self.jobs_analyzed, 2
             ) if self.jobs_analyzed > 0 else 0,
             'top_3_skills': top_3,
-            'categories': list(self.skills_by_category.keys()),
+            'categories': list(self._category_skills.keys()),
             'analysis_timestamp': datetime.now().isoformat()
         }
     
@@ -468,31 +1031,42 @@ class SkillDemandService:
         min_cooccurrence: int = 5,
         **filters
     ) -> Dict[str, Any]:
-        """Run complete skills demand analysis"""
+        """
+        Run complete skills demand analysis
         
-        # Extract data
-        jobs_data = self.extract_skills_from_jobs(limit=limit, **filters)
+        Jobs are streamed once; each job updates frequency, category,
+        co-occurrence and trend accumulators as it arrives.
+        """
+        
+        # Optional: trend analysis if date filter applied
+        trend_period = None
+        if filters.get('date_from') or filters.get('date_to'):
+            trend_period = 'month'
         
-        if not jobs_data:
+        # Extract data and run analyses in one pass
+        self._start_ingest(track_pairs=True, trend_period=trend_period)
+        for job in self.iter_jobs(limit=limit, **filters):
+            self.ingest(job)
+        
+        if not self.jobs_analyzed:
             return {
                 'error': 'No jobs with skills found',
                 'jobs_analyzed': 0
             }
         
-        # Run analyses
-        frequency_results = self.analyze_frequency(jobs_data)
-        cooccurrence_results = self.analyze_cooccurrence(
-            jobs_data,
+        frequency_results = self._frequency_results()
+        cooccurrence_results = self._cooccurrence_from_ids(
+            self._jobs_skill_ids,
             min_support=min_cooccurrence
         )
+        self._jobs_skill_ids = None
         top_skills = self.get_top_skills(n=top_n)
         category_dist = self.get_category_distribution()
         summary = self.generate_summary()
         
-        # Optional: trend analysis if date filter applied
         trends = None
-        if filters.get('date_from') or filters.get('date_to'):
-            trends = self.analyze_trends(jobs_data, period='month')
+        if trend_period:
+            trends = self._trend_results(trend_period, self._period_jobs, self._period_skills)
         
         return {
             'summary': summary,
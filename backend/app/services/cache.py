@@ -0,0 +1,68 @@
+# Location: backend/app/services/cache.py
+"""
+In-process TTL Cache
+Small time-bounded cache for hot, rarely-changing lookup tables
+
+Usage:
+    from app.services.cache import TTLCache
+
+    cache = TTLCache(ttl=300)
+    value = cache.get('key')
+    if value is None:
+        value = load()
+        cache.set('key', value)
+
+Entries are per process; writers should call clear() to invalidate,
+the TTL bounds staleness for other worker processes.
+"""
+
+import time
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe dict with per-entry expiry"""
+
+    def __init__(self, ttl: float = 300):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds an entry stays valid
+        """
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get cached value, or default if missing/expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Cache value for ttl seconds"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, key: Hashable):
+        """Drop a single entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -11,7 +11,9 @@ Usage:
 
 import re
 import html
-from typing import Optional
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Any, List
 
 
 class TextCleaner:
@@ -52,8 +54,9 @@ class TextCleaner:
             r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
         )
         
-        # Emails
-        self.email_pattern = re.compile(r'\S+@\S+')
+        # Emails (anchored to the start of a non-space run: same matches,
+        # without retrying \S+ from every character of every word)
+        self.email_pattern = re.compile(r'(?<!\S)\S+@\S+')
         
         # Numbers (standalone)
         self.number_pattern = re.compile(r'\b\d+\b')
@@ -63,6 +66,18 @@ class TextCleaner:
         
         # Special characters (keep basic punctuation)
         self.special_char_pattern = re.compile(r'[^a-zA-Z0-9\s.,;:!?()\-\'\"]+')
+        
+        # Special characters and whitespace together: replacing each run
+        # with one space equals special_char_pattern then space_pattern
+        self.special_space_pattern = re.compile(r'[^a-zA-Z0-9.,;:!?()\-\'\"]+')
+        
+        # Punctuation normalization
+        self.dup_punct_pattern = re.compile(r'([.,;:!?])\1+')
+        self.punct_space_pattern = re.compile(r'([.,;:!?])([a-zA-Z])')
+        
+        # Field-specific allowed characters
+        self.title_char_pattern = re.compile(r'[^a-zA-Z0-9\s\-/()&]')
+        self.skills_char_pattern = re.compile(r'[^a-zA-Z0-9\s,;.+#()\-/]')
     
     def clean(self, text: str) -> Optional[str]:
         """
@@ -81,15 +96,15 @@ class TextCleaner:
         text = html.unescape(text)
         
         # Remove HTML tags
-        if self.remove_html:
+        if self.remove_html and '<' in text:
             text = self.html_pattern.sub(' ', text)
         
         # Remove URLs
-        if self.remove_urls:
+        if self.remove_urls and '://' in text:
             text = self.url_pattern.sub(' ', text)
         
         # Remove emails
-        if self.remove_emails:
+        if self.remove_emails and '@' in text:
             text = self.email_pattern.sub(' ', text)
         
         # Remove numbers
@@ -97,10 +112,8 @@ class TextCleaner:
             text = self.number_pattern.sub(' ', text)
         
         # Remove special characters (keep basic punctuation)
-        text = self.special_char_pattern.sub(' ', text)
-        
-        # Normalize whitespace
-        text = self.space_pattern.sub(' ', text)
+        # and normalize whitespace in one pass
+        text = self.special_space_pattern.sub(' ', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -111,6 +124,47 @@ class TextCleaner:
         
         return text if text else None
     
+    def clean_batch(
+        self,
+        texts: List[str],
+        workers: Optional[int] = None,
+        chunk_size: int = 1024
+    ) -> List[Optional[str]]:
+        """
+        Clean many texts across worker processes
+        
+        Texts are sent in chunks of chunk_size to amortize pickling;
+        each worker builds one cleaner with this cleaner's options.
+        Batches of a single chunk are cleaned in-process.
+        
+        Args:
+            texts: Raw texts to clean
+            workers: Worker processes (default: CPU count)
+            chunk_size: Texts per task
+            
+        Returns:
+            Cleaned texts, in input order
+        """
+        if len(texts) <= chunk_size:
+            return [self.clean(text) for text in texts]
+        
+        options = self._options()
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_clean_chunk, [options] * len(chunks), chunks)
+            return [text for chunk in results for text in chunk]
+    
+    def _options(self) -> Tuple[Tuple[str, Any], ...]:
+        """Constructor options as sorted (name, value) pairs"""
+        return (
+            ('lowercase', self.lowercase),
+            ('remove_emails', self.remove_emails),
+            ('remove_html', self.remove_html),
+            ('remove_numbers', self.remove_numbers),
+            ('remove_urls', self.remove_urls),
+        )
+    
     def remove_extra_whitespace(self, text: str) -> str:
         """Remove multiple spaces and normalize whitespace"""
         if not text:
@@ -141,10 +195,10 @@ class TextCleaner:
             return ""
         
         # Remove duplicate punctuation
-        text = re.sub(r'([.,;:!?])\1+', r'\1', text)
+        text = self.dup_punct_pattern.sub(r'\1', text)
         
         # Add space after punctuation if missing
-        text = re.sub(r'([.,;:!?])([a-zA-Z])', r'\1 \2', text)
+        text = self.punct_space_pattern.sub(r'\1 \2', text)
         
         return text
     
@@ -165,7 +219,7 @@ class TextCleaner:
         text = title.strip()
         
         # Remove special characters but keep hyphen and slash
-        text = re.sub(r'[^a-zA-Z0-9\s\-/()&]', ' ', text)
+        text = self.title_char_pattern.sub(' ', text)
         
         # Normalize whitespace
         text = self.space_pattern.sub(' ', text).strip()
@@ -185,16 +239,8 @@ class TextCleaner:
         if not description:
             return None
         
-        # Full cleaning
-        cleaner = TextCleaner(
-            remove_html=True,
-            remove_urls=True,
-            remove_emails=True,
-            remove_numbers=False,  # Keep numbers in descriptions
-            lowercase=False
-        )
-        
-        return cleaner.clean(description)
+        # Full cleaning (shared cleaner with description options)
+        return _get_cleaner(_DESCRIPTION_OPTIONS).clean(description)
     
     def clean_skills(self, skills: str) -> Optional[str]:
         """
@@ -213,7 +259,7 @@ class TextCleaner:
         text = self.html_pattern.sub(' ', skills)
         
         # Keep basic punctuation (comma, semicolon for separators)
-        text = re.sub(r'[^a-zA-Z0-9\s,;.+#()\-/]', ' ', text)
+        text = self.skills_char_pattern.sub(' ', text)
         
         # Normalize whitespace
         text = self.space_pattern.sub(' ', text).strip()
@@ -221,6 +267,36 @@ class TextCleaner:
         return text if text else None
 
 
+# Options used for job descriptions
+_DESCRIPTION_OPTIONS = (
+    ('lowercase', False),
+    ('remove_emails', True),
+    ('remove_html', True),
+    ('remove_numbers', False),  # Keep numbers in descriptions
+    ('remove_urls', True),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_cleaner(options: Tuple[Tuple[str, Any], ...] = ()) -> TextCleaner:
+    """
+    Shared TextCleaner per option set
+    
+    Cleaners hold only compiled patterns, so one instance can be
+    reused instead of recompiling on every call.
+    
+    Args:
+        options: Sorted (name, value) pairs of TextCleaner kwargs
+    """
+    return TextCleaner(**dict(options))
+
+
+def _clean_chunk(options: Tuple[Tuple[str, Any], ...], texts: List[str]) -> List[Optional[str]]:
+    """Worker for TextCleaner.clean_batch (cleaner cached per process)"""
+    cleaner = _get_cleaner(options)
+    return [cleaner.clean(text) for text in texts]
+
+
 # Convenience functions
 def clean_text(text: str, **kwargs) -> Optional[str]:
     """
@@ -233,26 +309,22 @@ def clean_text(text: str, **kwargs) -> Optional[str]:
     Returns:
         Cleaned text
     """
-    cleaner = TextCleaner(**kwargs)
-    return cleaner.clean(text)
+    return _get_cleaner(tuple(sorted(kwargs.items()))).clean(text)
 
 
 def clean_job_title(title: str) -> Optional[str]:
     """Quick job title cleaning"""
-    cleaner = TextCleaner()
-    return cleaner.clean_job_title(title)
+    return _get_cleaner().clean_job_title(title)
 
 
 def clean_job_description(description: str) -> Optional[str]:
     """Quick job description cleaning"""
-    cleaner = TextCleaner()
-    return cleaner.clean_job_description(description)
+    return _get_cleaner(_DESCRIPTION_OPTIONS).clean(description) if description else None
 
 
 def clean_skills(skills: str) -> Optional[str]:
     """Quick skills cleaning"""
-    cleaner = TextCleaner()
-    return cleaner.clean_skills(skills)
+    return _get_cleaner().clean_skills(skills)
 
 
 if __name__ == "__main__":
@@ -11,8 +11,11 @@ Usage:
             pass
 """
 
+import copy
+import functools
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Type
 from app.services.preprocessing.text_cleaner import TextCleaner
 from app.services.preprocessing.indonesian_nlp import IndonesianNLP
 
@@ -56,6 +59,56 @@ class BaseTokenizer(ABC):
         """
         pass
     
+    def tokenize_batch(
+        self,
+        texts: List[str],
+        workers: int = 0,
+        chunk_size: int = 1024
+    ) -> List[Dict[str, Any]]:
+        """
+        Tokenize many texts, each distinct text once
+        
+        Scraped titles and benefit blocks repeat heavily, so repeated
+        inputs are tokenized once and get deep copies of that result;
+        every returned dict can be modified independently.
+        
+        With workers > 1, distinct texts are sent to worker processes
+        in chunks of chunk_size; each worker builds one tokenizer of
+        this class (tokenizers must take no constructor arguments).
+        Batches of a single chunk are tokenized in-process.
+        
+        Args:
+            texts: Texts to tokenize
+            workers: Worker processes (0 or 1: tokenize in-process)
+            chunk_size: Distinct texts per task
+            
+        Returns:
+            Tokenization results, in input order
+        """
+        distinct = list(dict.fromkeys(texts))
+        
+        if workers > 1 and len(distinct) > chunk_size:
+            chunks = [distinct[i:i + chunk_size] for i in range(0, len(distinct), chunk_size)]
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk_results = executor.map(_tokenize_chunk, [type(self)] * len(chunks), chunks)
+                results = dict(zip(distinct, (r for chunk in chunk_results for r in chunk)))
+        else:
+            results = {text: self.tokenize(text) for text in distinct}
+        
+        # First occurrence keeps the original, repeats get copies
+        seen = set()
+        output = []
+        for text in texts:
+            result = results[text]
+            if text in seen:
+                result = copy.deepcopy(result)
+            else:
+                seen.add(text)
+            output.append(result)
+        
+        return output
+    
     def preprocess(self, text: str) -> Optional[str]:
         """
         Preprocess text before tokenization
@@ -146,6 +199,19 @@ class BaseTokenizer(ABC):
         
         return True
     
+    def preview(self, text: str, limit: int = 200) -> str:
+        """
+        Shorten text for the 'original' result field
+        
+        Args:
+            text: Input text
+            limit: Max characters kept before '...'
+            
+        Returns:
+            text itself when short enough, else a truncated copy
+        """
+        return text if len(text) <= limit else f'{text[:limit]}...'
+    
     def get_token_count(self, text: str) -> int:
         """
         Get token count
@@ -177,6 +243,18 @@ class BaseTokenizer(ABC):
         return {'result': result}
 
 
+@functools.lru_cache(maxsize=None)
+def _get_tokenizer(tokenizer_class: Type[BaseTokenizer]) -> BaseTokenizer:
+    """One tokenizer per class per process"""
+    return tokenizer_class()
+
+
+def _tokenize_chunk(tokenizer_class: Type[BaseTokenizer], texts: List[str]) -> List[Dict[str, Any]]:
+    """Worker for BaseTokenizer.tokenize_batch (tokenizer cached per process)"""
+    tokenizer = _get_tokenizer(tokenizer_class)
+    return [tokenizer.tokenize(text) for text in texts]
+
+
 class TokenizerResult:
     """Container for tokenization results"""
     
@@ -16,18 +16,100 @@ Usage:
 """
 
 import re
-from typing import Dict, Any, List
+import sys
+import functools
+from typing import Dict, Any, List, Tuple, Iterator, NamedTuple
 from app.services.preprocessing.tokenizers.base_tokenizer import BaseTokenizer
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
+
+# Bullet patterns, compiled once. Each item runs up to the next line
+# that starts with a marker (or end of text); written line-by-line
+# instead of a lazy (.+?) with a lookahead at every character.
+_BULLET_RE = re.compile(r'[•·\-\*]\s*([^\n]+(?:\n(?![•·\-\*])[^\n]*)*)')
+_NUMBERED_RE = re.compile(r'\d+\.\s*([^\n]+(?:\n(?!\d+\.)[^\n]*)*)')
+
+
+class BenefitInfo(NamedTuple):
+    """One parsed benefit; use ._asdict() where a plain dict is needed"""
+    text: str
+    normalized: str
+    category: str
+    is_monetary: bool
+
 
 class BenefitTokenizer(BaseTokenizer):
     """Tokenize job benefits"""
     
+    # Common normalizations (longest matching key wins)
+    NORMALIZATIONS = {
+        'asuransi kesehatan': 'health insurance',
+        'bpjs kesehatan': 'health insurance',
+        'bpjs ketenagakerjaan': 'employment insurance',
+        'cuti tahunan': 'annual leave',
+        'thr': 'holiday allowance',
+        'bonus tahunan': 'annual bonus',
+        'wfh': 'work from home',
+        'work from home': 'remote work',
+    }
+    
+    MONETARY_KEYWORDS = (
+        'gaji', 'salary', 'bonus', 'tunjangan', 'allowance',
+        'komisi', 'insentif', 'rp', 'rupiah', 'juta', 'ribu'
+    )
+    
     def __init__(self):
         super().__init__(use_cleaner=True, use_indonesian_nlp=True, lowercase=True)
         
         # Benefit categories
         self.benefit_categories = self._load_benefit_categories()
+        # Interned: results become keys of 'categorized' and downstream groupings
+        self._category_names = [sys.intern(category) for category in self.benefit_categories]
+        
+        # Longest key first, so 'bpjs kesehatan' would beat a bare 'bpjs'
+        self._normalizations = tuple(
+            sorted(self.NORMALIZATIONS.items(), key=lambda kv: -len(kv[0]))
+        )
+        
+        # Flat parallel keyword / category index tables
+        self._kw_list, self._kw_cat = zip(*[
+            (kw, index)
+            for index, keywords in enumerate(self.benefit_categories.values())
+            for kw in keywords
+        ])
+        
+        # One automaton over category + monetary keywords
+        self._matcher = self._build_matcher() if ahocorasick else None
+        
+        # Boilerplate bullets repeat heavily; both are pure given the tables
+        self._scan = functools.lru_cache(maxsize=8192)(self._scan)
+        self.normalize_benefit = functools.lru_cache(maxsize=8192)(self.normalize_benefit)
+    
+    def _build_matcher(self):
+        """
+        Build Aho-Corasick automaton over all keywords
+        
+        Values are (keyword, category indexes, is_monetary); a keyword
+        listed under several categories scores for each of them.
+        """
+        keyword_categories = {}
+        for kw, index in zip(self._kw_list, self._kw_cat):
+            keyword_categories.setdefault(kw, []).append(index)
+        
+        matcher = ahocorasick.Automaton()
+        for kw in set(keyword_categories) | set(self.MONETARY_KEYWORDS):
+            matcher.add_word(kw, (
+                kw,
+                tuple(keyword_categories.get(kw, ())),
+                kw in self.MONETARY_KEYWORDS
+            ))
+        
+        matcher.make_automaton()
+        return matcher
     
     def _load_benefit_categories(self) -> Dict[str, List[str]]:
         """Load benefit categories and keywords"""
@@ -77,37 +159,87 @@ class BenefitTokenizer(BaseTokenizer):
         if not text:
             return []
         
-        bullets = []
+        return list(self._iter_bullets(text))
+    
+    def _iter_bullets(self, text: str) -> Iterator[str]:
+        """
+        Yield cleaned bullets (whitespace collapsed, longer than 3 chars)
         
-        # Bullet symbols
-        pattern1 = r'[•·\-\*]\s*(.+?)(?=\n[•·\-\*]|\Z)'
-        matches1 = re.findall(pattern1, text, re.DOTALL)
-        bullets.extend([m.strip() for m in matches1 if m.strip()])
+        Separators are tried in order - bullet symbols and numbered
+        lists, then commas, then newlines - falling through only when
+        the previous ones found no items.
+        """
+        found = False
         
-        # Numbered lists
-        pattern2 = r'\d+\.\s*(.+?)(?=\n\d+\.|\Z)'
-        matches2 = re.findall(pattern2, text, re.DOTALL)
-        bullets.extend([m.strip() for m in matches2 if m.strip()])
+        # Bullet symbols, then numbered lists
+        for pattern in (_BULLET_RE, _NUMBERED_RE):
+            for match in pattern.finditer(text):
+                bullet = ' '.join(match.group(1).split())
+                if bullet:
+                    found = True
+                    if len(bullet) > 3:
+                        yield bullet
         
-        # Comma separated
-        if not bullets:
-            # Try comma separation
-            items = text.split(',')
-            bullets = [item.strip() for item in items if item.strip() and len(item.strip()) > 5]
+        # Comma separated, then newline separated
+        for separator in (',', '\n'):
+            if found:
+                return
+            
+            for item in text.split(separator):
+                item = item.strip()
+                if len(item) > 5:
+                    found = True
+                    bullet = ' '.join(item.split())
+                    if len(bullet) > 3:
+                        yield bullet
+    
+    def _scan(self, benefit: str) -> Tuple[str, bool]:
+        """
+        Categorize benefit and detect monetary keywords in one pass
         
-        # Newline separated
-        if not bullets:
-            lines = text.split('\n')
-            bullets = [line.strip() for line in lines if line.strip() and len(line.strip()) > 5]
+        Args:
+            benefit: Benefit text
+            
+        Returns:
+            (category, is_monetary)
+        """
+        benefit_lower = benefit.lower()
         
-        # Clean bullets
-        cleaned = []
-        for bullet in bullets:
-            bullet = ' '.join(bullet.split())
-            if len(bullet) > 3:
-                cleaned.append(bullet)
+        if self._matcher is None:
+            return self._scan_keywords(benefit_lower)
         
-        return cleaned
+        # Each distinct keyword counts once, like `kw in benefit_lower`
+        hits = {value for _, value in self._matcher.iter(benefit_lower)}
+        
+        scores = [0] * len(self._category_names)
+        is_monetary = False
+        for _, category_indexes, monetary in hits:
+            is_monetary = is_monetary or monetary
+            for index in category_indexes:
+                scores[index] += 1
+        
+        return self._best_category(scores), is_monetary
+    
+    def _scan_keywords(self, benefit_lower: str) -> Tuple[str, bool]:
+        """Keyword-by-keyword _scan fallback without pyahocorasick"""
+        # Score each category over the flat keyword table
+        scores = [0] * len(self._category_names)
+        for kw, index in zip(self._kw_list, self._kw_cat):
+            if kw in benefit_lower:
+                scores[index] += 1
+        
+        is_monetary = any(kw in benefit_lower for kw in self.MONETARY_KEYWORDS)
+        
+        return self._best_category(scores), is_monetary
+    
+    def _best_category(self, scores: List[int]) -> str:
+        """Highest scoring category, earliest on ties; 'other' if none"""
+        best_score = max(scores)
+        if best_score == 0:
+            return 'other'
+        
+        # list.index finds the earliest category with that score
+        return self._category_names[scores.index(best_score)]
     
     def categorize_benefit(self, benefit: str) -> str:
         """
@@ -119,20 +251,7 @@ class BenefitTokenizer(BaseTokenizer):
         Returns:
             Category name
         """
-        benefit_lower = benefit.lower()
-        
-        # Score each category
-        scores = {}
-        for category, keywords in self.benefit_categories.items():
-            score = sum(1 for kw in keywords if kw in benefit_lower)
-            if score > 0:
-                scores[category] = score
-        
-        # Return highest score
-        if scores:
-            return max(scores.items(), key=lambda x: x[1])[0]
-        
-        return 'other'
+        return self._scan(benefit)[0]
     
     def is_monetary(self, benefit: str) -> bool:
         """
@@ -144,14 +263,7 @@ class BenefitTokenizer(BaseTokenizer):
         Returns:
             True if monetary
         """
-        benefit_lower = benefit.lower()
-        
-        monetary_keywords = [
-            'gaji', 'salary', 'bonus', 'tunjangan', 'allowance',
-            'komisi', 'insentif', 'rp', 'rupiah', 'juta', 'ribu'
-        ]
-        
-        return any(kw in benefit_lower for kw in monetary_keywords)
+        return self._scan(benefit)[1]
     
     def normalize_benefit(self, benefit: str) -> str:
         """
@@ -163,21 +275,9 @@ class BenefitTokenizer(BaseTokenizer):
         Returns:
             Normalized benefit
         """
-        # Common normalizations
-        normalizations = {
-            'asuransi kesehatan': 'health insurance',
-            'bpjs kesehatan': 'health insurance',
-            'bpjs ketenagakerjaan': 'employment insurance',
-            'cuti tahunan': 'annual leave',
-            'thr': 'holiday allowance',
-            'bonus tahunan': 'annual bonus',
-            'wfh': 'work from home',
-            'work from home': 'remote work',
-        }
-        
         benefit_lower = benefit.lower().strip()
         
-        for key, value in normalizations.items():
+        for key, value in self._normalizations:
             if key in benefit_lower:
                 return value
         
@@ -191,7 +291,8 @@ class BenefitTokenizer(BaseTokenizer):
             text: Benefits text
             
         Returns:
-            Dictionary with parsed benefits
+            Dictionary with parsed benefits ('benefits' holds BenefitInfo
+            tuples)
         """
         if not self.validate_input(text):
             return {
@@ -212,19 +313,12 @@ class BenefitTokenizer(BaseTokenizer):
         monetary_benefits = []
         
         for bullet in bullets:
-            # Categorize
-            category = self.categorize_benefit(bullet)
-            is_monetary = self.is_monetary(bullet)
+            # Categorize (single keyword scan)
+            category, is_monetary = self._scan(bullet)
             normalized = self.normalize_benefit(bullet)
             
             # Build data
-            benefit_info = {
-                'text': bullet,
-                'normalized': normalized,
-                'category': category,
-                'is_monetary': is_monetary
-            }
-            benefit_data.append(benefit_info)
+            benefit_data.append(BenefitInfo(bullet, normalized, category, is_monetary))
             
             # Group by category
             if category not in categorized:
@@ -242,7 +336,7 @@ class BenefitTokenizer(BaseTokenizer):
             'categorized': categorized,
             'monetary_benefits': monetary_benefits,
             'categories': list(categorized.keys()),
-            'original': text[:200] + '...' if len(text) > 200 else text,
+            'original': self.preview(text),
             'metadata': {
                 'has_insurance': 'insurance' in categorized,
                 'has_leave': 'leave' in categorized,
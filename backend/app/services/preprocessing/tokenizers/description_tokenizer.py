@@ -290,7 +290,7 @@ class DescriptionTokenizer(BaseTokenizer):
             'summary': summary,
             'token_count': len(all_tokens),
             'char_count': len(cleaned),
-            'original': text[:200] + '...' if len(text) > 200 else text,
+            'original': self.preview(text),
             'metadata': {
                 'has_sections': len(sections) > 0,
                 'has_bullets': len(bullet_points) > 0,
@@ -16,9 +16,48 @@ Usage:
 """
 
 import re
-from typing import Dict, Any, Optional, List
+import sys
+import bisect
+import functools
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple, Iterator
 from app.services.preprocessing.tokenizers.base_tokenizer import BaseTokenizer, TokenizerResult
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
+
+# Title patterns, compiled once
+_LOC_DASH_RE = re.compile(r'[-–]\s*([A-Za-z\s]+)\s*$')
+_LOC_PAREN_RE = re.compile(r'\(([A-Za-z\s]+)\)')
+_TRAIL_DASH_RE = re.compile(r'\s*[-–]\s*\w+\s*$')
+_PAREN_STRIP_RE = re.compile(r'\s*\([^)]+\)')
+_PAREN_GROUP_RE = re.compile(r'\(([^)]+)\)')
+
+# Tech separators / and & folded into commas for a plain str.split
+_TECH_SEP = str.maketrans({'/': ',', '&': ','})
+
+
+class _TitleView:
+    """A title with its lowercase form and words, computed once"""
+    
+    __slots__ = ('raw', 'lower', 'words')
+    
+    def __init__(self, title: str):
+        self.raw = title
+        self.lower = title.lower()
+        self.words = self.lower.split()
+
+
+class _TitleParts(NamedTuple):
+    """Fields extracted from one title by _tokenize_core"""
+    level: Optional[str]
+    role: Optional[str]
+    location: Optional[str]
+    tech_stack: List[str]
+    normalized: str
+
 
 class JobTitleTokenizer(BaseTokenizer):
     """Tokenize and extract information from job titles"""
@@ -56,48 +95,176 @@ class JobTitleTokenizer(BaseTokenizer):
             'data', 'machine learning', 'ai', 'devops', 'cloud', 'security',
             'network', 'system', 'database', 'qa', 'quality assurance',
         ]
+        
+        # Flat parallel keyword / level index tables, in priority order
+        self._level_names = [sys.intern(level) for level in self.levels]
+        self._level_kw_list, self._level_kw_idx = zip(*[
+            (kw, index)
+            for index, keywords in enumerate(self.levels.values())
+            for kw in keywords
+        ])
+        
+        # keyword -> (keyword, level index, role index, tech index)
+        self._keyword_tags = self._build_keyword_tags()
+        self._sorted_keywords = sorted(self._keyword_tags)
+        
+        # One automaton over level, role and tech keywords
+        self._keyword_matcher = self._build_keyword_matcher() if ahocorasick else None
+        
+        # Titles repeat heavily across postings; scans are pure given the tables
+        self._scan_keywords = functools.lru_cache(maxsize=8192)(self._scan_keywords)
     
-    def extract_level(self, title: str) -> Optional[str]:
+    def _build_keyword_tags(self) -> Dict[str, Tuple[str, Optional[int], Optional[int], Optional[int]]]:
+        """
+        Tag every level, role and tech keyword with its table positions
+        
+        Values are (keyword, level index, role index, tech index), with
+        None where the keyword is not in that table.
+        """
+        tags = {}
+        tables = (
+            list(zip(self._level_kw_idx, self._level_kw_list)),
+            list(enumerate(self.common_roles)),
+            list(enumerate(self.tech_prefixes)),
+        )
+        for source, entries in enumerate(tables):
+            for index, kw in entries:
+                tag = tags.setdefault(kw, [None, None, None])
+                if tag[source] is None:  # First listing wins
+                    tag[source] = index
+        
+        return {kw: (kw, *tag) for kw, tag in tags.items()}
+    
+    def _build_keyword_matcher(self):
+        """Build Aho-Corasick automaton over the tagged keywords"""
+        matcher = ahocorasick.Automaton()
+        for kw, value in self._keyword_tags.items():
+            matcher.add_word(kw, value)
+        
+        matcher.make_automaton()
+        return matcher
+    
+    def complete_keyword(self, prefix: str, limit: int = 10) -> List[Dict[str, Optional[str]]]:
+        """
+        Autocomplete level, role and tech keywords from a prefix
+        
+        Args:
+            prefix: Typed prefix, e.g. "sen"
+            limit: Max suggestions
+            
+        Returns:
+            Matching keywords in alphabetical order, each with the level,
+            role and tech prefix it belongs to (None if not in that table)
+        """
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+        
+        suggestions = []
+        start = bisect.bisect_left(self._sorted_keywords, prefix)
+        
+        for kw in self._sorted_keywords[start:]:
+            if not kw.startswith(prefix) or len(suggestions) >= limit:
+                break
+            
+            _, level_index, role_index, tech_index = self._keyword_tags[kw]
+            suggestions.append({
+                'keyword': kw,
+                'level': self._level_names[level_index] if level_index is not None else None,
+                'role': self.common_roles[role_index] if role_index is not None else None,
+                'tech': self.tech_prefixes[tech_index] if tech_index is not None else None,
+            })
+        
+        return suggestions
+    
+    def _scan_keywords(self, title_lower: str) -> Tuple[Optional[str], Optional[str], Tuple[str, ...]]:
+        """
+        Match level, role and tech keywords in one pass
+        
+        Args:
+            title_lower: Lowercased job title
+            
+        Returns:
+            (first level in self.levels order, first common role,
+            tech prefixes in list order) - all by substring match
+        """
+        if self._keyword_matcher is None:
+            level = next(
+                (self._level_names[index]
+                 for keyword, index in zip(self._level_kw_list, self._level_kw_idx)
+                 if keyword in title_lower),
+                None
+            )
+            role = next((role for role in self.common_roles if role in title_lower), None)
+            techs = tuple(tech for tech in self.tech_prefixes if tech in title_lower)
+            return level, role, techs
+        
+        hits = {value for _, value in self._keyword_matcher.iter(title_lower)}
+        
+        level_ids = [hit[1] for hit in hits if hit[1] is not None]
+        role_ids = [hit[2] for hit in hits if hit[2] is not None]
+        tech_ids = sorted(hit[3] for hit in hits if hit[3] is not None)
+        
+        level = self._level_names[min(level_ids)] if level_ids else None
+        role = self.common_roles[min(role_ids)] if role_ids else None
+        techs = tuple(self.tech_prefixes[index] for index in tech_ids)
+        
+        return level, role, techs
+    
+    def _level_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        All level keyword occurrences in lowercased text
+        
+        Yields:
+            (start offset, end offset, level index) per occurrence
+        """
+        if self._keyword_matcher is None:
+            for keyword, index in zip(self._level_kw_list, self._level_kw_idx):
+                start = text.find(keyword)
+                while start != -1:
+                    yield start, start + len(keyword), index
+                    start = text.find(keyword, start + 1)
+            return
+        
+        for last, (keyword, index, _, _) in self._keyword_matcher.iter(text):
+            if index is not None:
+                yield last - len(keyword) + 1, last + 1, index
+    
+    def extract_level(self, title: str, title_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract job level from title
         
         Args:
             title: Job title
+            title_lower: title.lower(), if the caller already has it
             
         Returns:
             Job level or None
         """
-        title_lower = title.lower()
-        
-        for level, keywords in self.levels.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    return level
-        
-        return None
+        return self._scan_keywords(title_lower or title.lower())[0]
     
-    def extract_role(self, title: str) -> Optional[str]:
+    def extract_role(self, title: str, title_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract primary job role
         
         Args:
             title: Job title
+            title_lower: title.lower(), if the caller already has it
             
         Returns:
             Job role
         """
-        title_lower = title.lower()
-        
-        # Find common roles
-        found_roles = []
-        for role in self.common_roles:
-            if role in title_lower:
-                found_roles.append(role)
+        title_lower = title_lower or title.lower()
         
-        # Return first found role
-        if found_roles:
-            return found_roles[0]
+        # Return first found common role
+        role = self._scan_keywords(title_lower)[1]
+        if role:
+            return role
         
+        return self._role_from_remainder(title_lower)
+    
+    def _role_from_remainder(self, title_lower: str) -> Optional[str]:
+        """Role fallback: last words of the title without level/location"""
         # If no common role found, extract main noun phrase
         # Remove level keywords
         cleaned = title_lower
@@ -106,7 +273,7 @@ class JobTitleTokenizer(BaseTokenizer):
                 cleaned = cleaned.replace(keyword, '')
         
         # Remove location indicators
-        cleaned = re.sub(r'\s*[-–]\s*\w+\s*$', '', cleaned)
+        cleaned = _TRAIL_DASH_RE.sub('', cleaned)
         
         # Clean and return
         cleaned = cleaned.strip()
@@ -130,7 +297,7 @@ class JobTitleTokenizer(BaseTokenizer):
         # Pattern: "- Location" or "(Location)"
         
         # Pattern 1: Dash separator
-        match = re.search(r'[-–]\s*([A-Za-z\s]+)\s*$', title)
+        match = _LOC_DASH_RE.search(title)
         if match:
             location = match.group(1).strip()
             # Check if it's a valid location (simple heuristic)
@@ -138,7 +305,7 @@ class JobTitleTokenizer(BaseTokenizer):
                 return location
         
         # Pattern 2: Parentheses
-        match = re.search(r'\(([A-Za-z\s]+)\)', title)
+        match = _LOC_PAREN_RE.search(title)
         if match:
             location = match.group(1).strip()
             if len(location.split()) <= 3:
@@ -146,28 +313,31 @@ class JobTitleTokenizer(BaseTokenizer):
         
         return None
     
-    def extract_tech_stack(self, title: str) -> List[str]:
+    def extract_tech_stack(self, title: str, title_lower: Optional[str] = None) -> List[str]:
         """
         Extract technology/domain from title
         
         Args:
             title: Job title
+            title_lower: title.lower(), if the caller already has it
             
         Returns:
             List of technologies
         """
-        title_lower = title.lower()
-        tech_found = []
+        tech_found = list(self._scan_keywords(title_lower or title.lower())[2])
+        tech_found.extend(self._tech_in_parens(title))
         
-        for tech in self.tech_prefixes:
-            if tech in title_lower:
-                tech_found.append(tech)
+        return tech_found
+    
+    def _tech_in_parens(self, title: str) -> List[str]:
+        """Technologies listed in parentheses, split on / , &"""
+        tech_found = []
         
         # Also extract from parentheses or slashes
         # Example: "Developer (React/Node.js)"
-        tech_in_parens = re.findall(r'\(([^)]+)\)', title)
+        tech_in_parens = _PAREN_GROUP_RE.findall(title)
         for tech_group in tech_in_parens:
-            techs = re.split(r'[/,&]', tech_group)
+            techs = tech_group.translate(_TECH_SEP).split(',')
             tech_found.extend([t.strip().lower() for t in techs if t.strip()])
         
         return tech_found
@@ -189,16 +359,38 @@ class JobTitleTokenizer(BaseTokenizer):
             return ""
         
         # Remove location part
-        cleaned = re.sub(r'\s*[-–]\s*\w+\s*$', '', cleaned)
+        cleaned = _TRAIL_DASH_RE.sub('', cleaned)
         
         # Remove content in parentheses (usually tech stack)
-        cleaned = re.sub(r'\s*\([^)]+\)', '', cleaned)
+        cleaned = _PAREN_STRIP_RE.sub('', cleaned)
         
         # Normalize whitespace
         cleaned = ' '.join(cleaned.split())
         
         return cleaned
     
+    def _tokenize_core(self, view: _TitleView) -> _TitleParts:
+        """
+        Extract level, role, location, tech stack and normalized title
+        
+        Uses the view's single lowercase and matches all keyword tables
+        in one scan; same results as the individual extract_* methods.
+        """
+        level, role, techs = self._scan_keywords(view.lower)
+        tech_stack = list(techs)
+        
+        if not role:
+            role = self._role_from_remainder(view.lower)
+        tech_stack.extend(self._tech_in_parens(view.raw))
+        
+        return _TitleParts(
+            level=level,
+            role=role,
+            location=self.extract_location(view.raw),
+            tech_stack=tech_stack,
+            normalized=self.normalize_title(view.raw)
+        )
+    
     def tokenize(self, text: str) -> Dict[str, Any]:
         """
         Tokenize job title
@@ -222,11 +414,7 @@ class JobTitleTokenizer(BaseTokenizer):
             }
         
         # Extract information
-        level = self.extract_level(text)
-        role = self.extract_role(text)
-        location = self.extract_location(text)
-        tech_stack = self.extract_tech_stack(text)
-        normalized = self.normalize_title(text)
+        level, role, location, tech_stack, normalized = self._tokenize_core(_TitleView(text))
         
         # Tokenize normalized title
         tokens = self.split_tokens(normalized)
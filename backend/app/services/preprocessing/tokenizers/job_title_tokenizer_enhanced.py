@@ -10,13 +10,23 @@ Usage:
     )
 """
 
+import sys
+import functools
 from typing import Dict, Any, Optional, Tuple
-from app.services.preprocessing.tokenizers.job_title_tokenizer import JobTitleTokenizer as BaseJobTitleTokenizer
+from app.services.preprocessing.tokenizers.job_title_tokenizer import JobTitleTokenizer as BaseJobTitleTokenizer, _TitleView
 
 
 class JobTitleTokenizerEnhanced(BaseJobTitleTokenizer):
     """Enhanced tokenizer with confidence scoring and data reconciliation"""
     
+    def __init__(self):
+        super().__init__()
+        
+        # Returns an immutable (level, confidence) pair, safe to cache
+        self.extract_level_with_confidence = functools.lru_cache(maxsize=8192)(
+            self.extract_level_with_confidence
+        )
+    
     def extract_level_with_confidence(self, title: str) -> Tuple[Optional[str], float]:
         """
         Extract job level with confidence score
@@ -31,28 +41,44 @@ class JobTitleTokenizerEnhanced(BaseJobTitleTokenizer):
         if not title:
             return (None, 0.0)
         
-        title_lower = title.lower()
-        title_words = title_lower.split()
+        return self._level_with_confidence(_TitleView(title))
+    
+    def _level_with_confidence(self, view: _TitleView) -> Tuple[Optional[str], float]:
+        """extract_level_with_confidence on a prepared title view"""
+        title_lower = view.lower
+        title_words = view.words
+        
+        # One scan over the whitespace-normalized title; the first 2 and
+        # first 3 words are its prefixes, so tiers are offset checks
+        normalized = ' '.join(title_words)
+        first_two_end = len(' '.join(title_words[:2]))
+        first_three_end = len(' '.join(title_words[:3]))
+        
+        best = [None, None, None]  # Lowest level index per tier
+        for start, end, index in self._level_matches(normalized):
+            tiers = []
+            if start == 0 and end <= first_two_end:
+                tiers.append(0)
+            if end <= first_three_end:
+                tiers.append(1)
+            tiers.append(2)
+            
+            for tier in tiers:
+                if best[tier] is None or index < best[tier]:
+                    best[tier] = index
         
-        # HIGH CONFIDENCE (0.90-0.95): Level word at start of title
-        first_words = ' '.join(title_words[:2])  # First 2 words
-        for level, keywords in self.levels.items():
-            for keyword in keywords:
-                if first_words.startswith(keyword):
-                    return (level, 0.95)
+        # "Anywhere" matches the raw title; only rescan if split()
+        # collapsed whitespace that a multi-word keyword could span
+        if normalized != title_lower:
+            indexes = [index for _, _, index in self._level_matches(title_lower)]
+            best[2] = min(indexes) if indexes else None
         
+        # HIGH CONFIDENCE (0.90-0.95): Level word at start of title
         # MEDIUM-HIGH CONFIDENCE (0.75-0.85): Level word in first 3 words
-        first_three = ' '.join(title_words[:3])
-        for level, keywords in self.levels.items():
-            for keyword in keywords:
-                if keyword in first_three:
-                    return (level, 0.80)
-        
         # MEDIUM CONFIDENCE (0.60-0.70): Level word anywhere
-        for level, keywords in self.levels.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    return (level, 0.65)
+        for index, confidence in zip(best, (0.95, 0.80, 0.65)):
+            if index is not None:
+                return (self._level_names[index], confidence)
         
         # LOW CONFIDENCE (0.0): No level detected
         return (None, 0.0)
@@ -91,7 +117,7 @@ class JobTitleTokenizerEnhanced(BaseJobTitleTokenizer):
         
         # Case 2: Low confidence from title, use database
         elif db_level:
-            final_level = db_level
+            final_level = sys.intern(db_level) if isinstance(db_level, str) else db_level
             if title_level:
                 has_discrepancy = True
                 decision_reason = f"Low confidence from title ({confidence:.0%}), using database"
@@ -141,6 +167,12 @@ class JobTitleTokenizerEnhanced(BaseJobTitleTokenizer):
         return base_result
 
 
+@functools.lru_cache(maxsize=1)
+def _get_tokenizer() -> JobTitleTokenizerEnhanced:
+    """Shared tokenizer, built on first use (once per process)"""
+    return JobTitleTokenizerEnhanced()
+
+
 # Helper function for easy use
 def tokenize_job_title_smart(title: str, 
                               db_level: Optional[str] = None) -> Dict[str, Any]:
@@ -154,8 +186,7 @@ def tokenize_job_title_smart(title: str,
     Returns:
         Tokenization result with reconciled level
     """
-    tokenizer = JobTitleTokenizerEnhanced()
-    return tokenizer.tokenize_with_reconciliation(title, db_level)
+    return _get_tokenizer().tokenize_with_reconciliation(title, db_level)
 
 
 if __name__ == "__main__":
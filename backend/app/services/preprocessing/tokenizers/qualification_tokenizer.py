@@ -313,7 +313,7 @@ class QualificationTokenizer(BaseTokenizer):
             'required': required_quals,
             'preferred': preferred_quals,
             'categorized': categorized,
-            'original': text[:200] + '...' if len(text) > 200 else text,
+            'original': self.preview(text),
             'metadata': {
                 'has_education': education_found is not None,
                 'has_experience': experience_found is not None,
@@ -16,67 +16,162 @@ Usage:
 """
 
 import re
-from typing import Dict, Any, List, Set
+import functools
+from typing import Dict, Any, List, Tuple, Iterable, Optional, NamedTuple
 from app.services.preprocessing.tokenizers.base_tokenizer import BaseTokenizer
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
+
+# Bullet patterns, compiled once. Each item runs up to the next line
+# that starts with a marker (or end of text); written line-by-line
+# instead of a lazy (.+?) with a lookahead at every character.
+_BULLET_RE = re.compile(r'[•·\-\*]\s*([^\n]+(?:\n(?![•·\-\*])[^\n]*)*)')
+_NUMBERED_RE = re.compile(r'\d+\.\s*([^\n]+(?:\n(?!\d+\.)[^\n]*)*)')
+
+
+class _KeywordTag(NamedTuple):
+    """What one keyword counts toward, across all keyword tables"""
+    keyword: str
+    verb_rank: Optional[int]  # None if not an action verb
+    categories: Tuple[int, ...]  # Indexes into resp_categories
+    seniority: Tuple[int, ...]  # Indexes into seniority_keywords
+
 
 class ResponsibilityTokenizer(BaseTokenizer):
     """Tokenize job responsibilities"""
     
+    # Action verbs by category
+    ACTION_VERBS = {
+        'development': frozenset({
+            'develop', 'mengembangkan', 'build', 'membangun', 'create', 'membuat',
+            'implement', 'mengimplementasikan', 'code', 'coding', 'program', 'programming',
+            'design', 'mendesain', 'architect', 'merancang', 'construct', 'write', 'menulis'
+        }),
+        'management': frozenset({
+            'manage', 'mengelola', 'lead', 'memimpin', 'coordinate', 'mengkoordinasikan',
+            'supervise', 'mengawasi', 'organize', 'mengorganisir', 'plan', 'merencanakan',
+            'direct', 'mengarahkan', 'oversee', 'mengawasi', 'control', 'mengontrol'
+        }),
+        'analysis': frozenset({
+            'analyze', 'menganalisis', 'research', 'meneliti', 'investigate', 'menginvestigasi',
+            'evaluate', 'mengevaluasi', 'assess', 'menilai', 'review', 'mengulas',
+            'study', 'mempelajari', 'examine', 'memeriksa', 'test', 'menguji'
+        }),
+        'communication': frozenset({
+            'communicate', 'berkomunikasi', 'present', 'mempresentasikan',
+            'collaborate', 'berkolaborasi', 'coordinate', 'berkoordinasi',
+            'discuss', 'mendiskusikan', 'report', 'melaporkan', 'document', 'mendokumentasikan',
+            'meeting', 'rapat', 'explain', 'menjelaskan'
+        }),
+        'maintenance': frozenset({
+            'maintain', 'memelihara', 'support', 'mendukung', 'troubleshoot', 'mengatasi',
+            'fix', 'memperbaiki', 'update', 'memperbarui', 'upgrade', 'mengupgrade',
+            'optimize', 'mengoptimalkan', 'monitor', 'memantau', 'ensure', 'memastikan'
+        }),
+        'training': frozenset({
+            'train', 'melatih', 'mentor', 'membimbing', 'teach', 'mengajar',
+            'guide', 'memandu', 'coach', 'melatih', 'educate', 'mengedukasi'
+        })
+    }
+    
+    # Responsibility category keywords
+    RESP_CATEGORIES = {
+        'technical': ('code', 'develop', 'programming', 'system', 'database', 'api', 'software'),
+        'leadership': ('lead', 'manage', 'team', 'coordinate', 'supervise', 'direct'),
+        'analytical': ('analyze', 'research', 'data', 'report', 'metrics', 'evaluate'),
+        'collaborative': ('collaborate', 'work with', 'coordinate', 'meeting', 'communicate'),
+        'operational': ('maintain', 'support', 'monitor', 'ensure', 'implement', 'execute'),
+    }
+    
+    # Seniority indicator keywords
+    SENIORITY_KEYWORDS = {
+        'leadership': ('lead', 'manage', 'mentor', 'supervise', 'team', 'memimpin', 'mengelola'),
+        'management': ('budget', 'plan', 'strategy', 'roadmap', 'anggaran', 'strategi'),
+        'technical': ('code', 'develop', 'implement', 'build', 'programming', 'mengembangkan'),
+        'strategic': ('strategy', 'vision', 'direction', 'objectives', 'strategi', 'visi'),
+    }
+    
     def __init__(self):
         super().__init__(use_cleaner=True, use_indonesian_nlp=True, lowercase=True)
         
-        # Action verbs
-        self.action_verbs = self._load_action_verbs()
+        # Keyword tables (shared, read-only)
+        self.action_verbs = self.ACTION_VERBS
+        self.resp_categories = self.RESP_CATEGORIES
+        self._category_names = list(self.resp_categories)
+        self.seniority_keywords = self.SENIORITY_KEYWORDS
+        
+        # Flat verb -> category (first category listing a verb wins) and
+        # verb priority for extract_action_verb: category order, then set order
+        self._verb_to_category = {}
+        self._verb_rank = {}
+        for category, verbs in self.action_verbs.items():
+            for verb in verbs:
+                self._verb_to_category.setdefault(verb, category)
+                self._verb_rank.setdefault(verb, len(self._verb_rank))
+        
+        # Every verb / category / seniority keyword, tagged with what it
+        # counts toward, and one automaton over all of them
+        self._keyword_tags = self._build_keyword_tags()
+        self._matcher = self._build_matcher() if ahocorasick else None
         
-        # Responsibility categories
-        self.resp_categories = self._load_categories()
+        # Boilerplate bullets repeat across postings; pure given the tables
+        self._analyze_bullet = functools.lru_cache(maxsize=8192)(self._analyze_bullet)
     
-    def _load_action_verbs(self) -> Dict[str, Set[str]]:
-        """Load action verbs by category"""
-        return {
-            'development': {
-                'develop', 'mengembangkan', 'build', 'membangun', 'create', 'membuat',
-                'implement', 'mengimplementasikan', 'code', 'coding', 'program', 'programming',
-                'design', 'mendesain', 'architect', 'merancang', 'construct', 'write', 'menulis'
-            },
-            'management': {
-                'manage', 'mengelola', 'lead', 'memimpin', 'coordinate', 'mengkoordinasikan',
-                'supervise', 'mengawasi', 'organize', 'mengorganisir', 'plan', 'merencanakan',
-                'direct', 'mengarahkan', 'oversee', 'mengawasi', 'control', 'mengontrol'
-            },
-            'analysis': {
-                'analyze', 'menganalisis', 'research', 'meneliti', 'investigate', 'menginvestigasi',
-                'evaluate', 'mengevaluasi', 'assess', 'menilai', 'review', 'mengulas',
-                'study', 'mempelajari', 'examine', 'memeriksa', 'test', 'menguji'
-            },
-            'communication': {
-                'communicate', 'berkomunikasi', 'present', 'mempresentasikan',
-                'collaborate', 'berkolaborasi', 'coordinate', 'berkoordinasi',
-                'discuss', 'mendiskusikan', 'report', 'melaporkan', 'document', 'mendokumentasikan',
-                'meeting', 'rapat', 'explain', 'menjelaskan'
-            },
-            'maintenance': {
-                'maintain', 'memelihara', 'support', 'mendukung', 'troubleshoot', 'mengatasi',
-                'fix', 'memperbaiki', 'update', 'memperbarui', 'upgrade', 'mengupgrade',
-                'optimize', 'mengoptimalkan', 'monitor', 'memantau', 'ensure', 'memastikan'
-            },
-            'training': {
-                'train', 'melatih', 'mentor', 'membimbing', 'teach', 'mengajar',
-                'guide', 'memandu', 'coach', 'melatih', 'educate', 'mengedukasi'
-            }
-        }
+    def _group_index(self, keyword_groups: Iterable[Iterable[str]]) -> Dict[str, Tuple[int, ...]]:
+        """Map each keyword to the indexes of the groups listing it"""
+        index_lists = {}
+        for index, keywords in enumerate(keyword_groups):
+            for kw in keywords:
+                index_lists.setdefault(kw, []).append(index)
+        
+        return {kw: tuple(indexes) for kw, indexes in index_lists.items()}
     
-    def _load_categories(self) -> Dict[str, List[str]]:
-        """Load responsibility category keywords"""
+    def _build_keyword_tags(self) -> Dict[str, _KeywordTag]:
+        """
+        Merge the verb, category and seniority tables into one keyword map
+        
+        A keyword listed under several categories or seniority buckets
+        counts for each of them.
+        """
+        category_index = self._group_index(self.resp_categories.values())
+        seniority_index = self._group_index(self.seniority_keywords.values())
+        
         return {
-            'technical': ['code', 'develop', 'programming', 'system', 'database', 'api', 'software'],
-            'leadership': ['lead', 'manage', 'team', 'coordinate', 'supervise', 'direct'],
-            'analytical': ['analyze', 'research', 'data', 'report', 'metrics', 'evaluate'],
-            'collaborative': ['collaborate', 'work with', 'coordinate', 'meeting', 'communicate'],
-            'operational': ['maintain', 'support', 'monitor', 'ensure', 'implement', 'execute'],
+            kw: _KeywordTag(
+                kw,
+                self._verb_rank.get(kw),
+                category_index.get(kw, ()),
+                seniority_index.get(kw, ())
+            )
+            for kw in {**self._verb_rank, **category_index, **seniority_index}
         }
     
+    def _build_matcher(self):
+        """Build Aho-Corasick automaton over all tagged keywords"""
+        matcher = ahocorasick.Automaton()
+        for kw, tag in self._keyword_tags.items():
+            matcher.add_word(kw, tag)
+        
+        matcher.make_automaton()
+        return matcher
+    
+    def _scan(self, text_lower: str) -> Dict[str, _KeywordTag]:
+        """
+        Find every known keyword in text_lower, in one pass
+        
+        Returns:
+            Tags of the distinct keywords found, keyed by keyword
+            (each counts once, like `kw in text_lower`)
+        """
+        if self._matcher is None:
+            return {kw: tag for kw, tag in self._keyword_tags.items() if kw in text_lower}
+        
+        return {tag.keyword: tag for _, tag in self._matcher.iter(text_lower)}
+    
     def parse_bullet_points(self, text: str) -> List[str]:
         """
         Parse bullet points from text
@@ -90,49 +185,45 @@ class ResponsibilityTokenizer(BaseTokenizer):
         if not text:
             return []
         
-        bullets = []
-        
-        # Pattern 1: Bullet symbols (•, -, *)
-        pattern1 = r'[•·\-\*]\s*(.+?)(?=\n[•·\-\*]|\Z)'
-        matches1 = re.findall(pattern1, text, re.DOTALL)
-        bullets.extend([m.strip() for m in matches1 if m.strip()])
-        
-        # Pattern 2: Numbered lists (1., 2., etc)
-        pattern2 = r'\d+\.\s*(.+?)(?=\n\d+\.|\Z)'
-        matches2 = re.findall(pattern2, text, re.DOTALL)
-        bullets.extend([m.strip() for m in matches2 if m.strip()])
+        # Bullet symbols (•, -, *), then numbered lists (1., 2., etc),
+        # whitespace normalized (also removes newlines within a bullet)
+        bullets = [
+            ' '.join(match.split())
+            for pattern in (_BULLET_RE, _NUMBERED_RE)
+            for match in pattern.findall(text)
+        ]
         
         # If no bullets found, split by newlines
-        if not bullets:
-            lines = text.split('\n')
-            bullets = [line.strip() for line in lines if line.strip() and len(line.strip()) > 20]
-        
-        # Clean each bullet (remove extra newlines within bullet)
-        cleaned_bullets = []
-        for bullet in bullets:
-            bullet = ' '.join(bullet.split())  # Normalize whitespace
-            if len(bullet) > 15:  # Min 15 chars
-                cleaned_bullets.append(bullet)
-        
-        return cleaned_bullets
+        if not any(bullets):
+            bullets = [
+                ' '.join(line.split())
+                for line in text.split('\n')
+                if len(line.strip()) > 20
+            ]
+        
+        # Min 15 chars (also drops empty matches)
+        return [bullet for bullet in bullets if len(bullet) > 15]
     
-    def extract_action_verb(self, responsibility: str) -> str:
+    def extract_action_verb(self, responsibility: str, resp_lower: Optional[str] = None) -> str:
         """
         Extract primary action verb from responsibility
         
         Args:
             responsibility: Single responsibility statement
+            resp_lower: responsibility.lower(), if the caller already has it
             
         Returns:
             Primary action verb or empty string
         """
-        resp_lower = responsibility.lower()
-        
-        # Check each category
-        for category, verbs in self.action_verbs.items():
-            for verb in verbs:
-                if verb in resp_lower:
-                    return verb
+        resp_lower = resp_lower or responsibility.lower()
+        return self._action_verb(resp_lower, self._scan(resp_lower))
+    
+    def _action_verb(self, resp_lower: str, hits: Dict[str, _KeywordTag]) -> str:
+        """extract_action_verb given the bullet's keyword hits"""
+        # Known verb with the highest priority
+        verbs = [tag for tag in hits.values() if tag.verb_rank is not None]
+        if verbs:
+            return min(verbs, key=lambda tag: tag.verb_rank).keyword
         
         # If not found, extract first verb (word ending in common verb suffixes)
         words = resp_lower.split()
@@ -152,69 +243,84 @@ class ResponsibilityTokenizer(BaseTokenizer):
         Returns:
             Category name
         """
-        verb_lower = verb.lower()
-        
-        for category, verbs in self.action_verbs.items():
-            if verb_lower in verbs:
-                return category
-        
-        return "other"
+        return self._verb_to_category.get(verb.lower(), "other")
     
-    def categorize_responsibility(self, responsibility: str) -> str:
+    def categorize_responsibility(self, responsibility: str, resp_lower: Optional[str] = None) -> str:
         """
         Categorize entire responsibility statement
         
         Args:
             responsibility: Responsibility text
+            resp_lower: responsibility.lower(), if the caller already has it
             
         Returns:
             Category name
         """
-        resp_lower = responsibility.lower()
-        
+        resp_lower = resp_lower or responsibility.lower()
+        return self._best_category(self._scan(resp_lower))
+    
+    def _best_category(self, hits: Dict[str, _KeywordTag]) -> str:
+        """categorize_responsibility given the bullet's keyword hits"""
         # Score each category
-        scores = {}
-        for category, keywords in self.resp_categories.items():
-            score = sum(1 for keyword in keywords if keyword in resp_lower)
-            if score > 0:
-                scores[category] = score
+        scores = [0] * len(self._category_names)
+        for tag in hits.values():
+            for index in tag.categories:
+                scores[index] += 1
         
-        # Return highest scoring category
-        if scores:
-            return max(scores.items(), key=lambda x: x[1])[0]
+        # Return highest scoring category, earliest on ties
+        best_score = max(scores)
+        if best_score > 0:
+            return self._category_names[scores.index(best_score)]
         
         return "general"
     
-    def detect_seniority_indicators(self, responsibilities: List[str]) -> Dict[str, int]:
+    def detect_seniority_indicators(
+        self,
+        responsibilities: List[str],
+        responsibilities_lower: Optional[List[str]] = None
+    ) -> Dict[str, int]:
         """
         Detect seniority level from responsibilities
         
         Args:
             responsibilities: List of responsibility statements
+            responsibilities_lower: The same statements lowercased, if the caller already has them
             
         Returns:
             Dictionary with seniority indicators
         """
-        indicators = {
-            'leadership': 0,
-            'management': 0,
-            'technical': 0,
-            'strategic': 0,
-        }
+        if responsibilities_lower is not None:
+            all_text = ' '.join(responsibilities_lower)
+        else:
+            all_text = ' '.join(responsibilities).lower()
+        
+        return self._seniority_counts(self._scan(all_text).values())
+    
+    def _analyze_bullet(self, bullet: str) -> Tuple[str, str, str, Tuple[_KeywordTag, ...]]:
+        """
+        Analyze one bullet from a single keyword scan
         
-        leadership_keywords = ['lead', 'manage', 'mentor', 'supervise', 'team', 'memimpin', 'mengelola']
-        management_keywords = ['budget', 'plan', 'strategy', 'roadmap', 'anggaran', 'strategi']
-        technical_keywords = ['code', 'develop', 'implement', 'build', 'programming', 'mengembangkan']
-        strategic_keywords = ['strategy', 'vision', 'direction', 'objectives', 'strategi', 'visi']
+        Returns:
+            (action verb, action category, category, seniority keyword hits)
+        """
+        bullet_lower = bullet.lower()
+        hits = self._scan(bullet_lower)
         
-        all_text = ' '.join(responsibilities).lower()
+        action = self._action_verb(bullet_lower, hits)
+        action_category = self.categorize_action(action) if action else "other"
         
-        indicators['leadership'] = sum(1 for kw in leadership_keywords if kw in all_text)
-        indicators['management'] = sum(1 for kw in management_keywords if kw in all_text)
-        indicators['technical'] = sum(1 for kw in technical_keywords if kw in all_text)
-        indicators['strategic'] = sum(1 for kw in strategic_keywords if kw in all_text)
+        seniority_hits = tuple(tag for tag in hits.values() if tag.seniority)
         
-        return indicators
+        return action, action_category, self._best_category(hits), seniority_hits
+    
+    def _seniority_counts(self, hits: Iterable[_KeywordTag]) -> Dict[str, int]:
+        """detect_seniority_indicators given the distinct keyword hits"""
+        counts = [0] * len(self.seniority_keywords)
+        for tag in hits:
+            for index in tag.seniority:
+                counts[index] += 1
+        
+        return dict(zip(self.seniority_keywords, counts))
     
     def tokenize(self, text: str) -> Dict[str, Any]:
         """
@@ -241,16 +347,18 @@ class ResponsibilityTokenizer(BaseTokenizer):
         
         # Analyze each responsibility
         resp_data = []
-        action_verbs = []
+        action_verbs = {}  # Insertion-ordered set
         categorized = {}
         
+        # Distinct seniority keyword hits across all bullets. Seniority
+        # keywords have no spaces, so none can straddle two bullets of
+        # the joined text detect_seniority_indicators would scan.
+        all_hits = set()
+        
         for bullet in bullets:
-            # Extract action verb
-            action = self.extract_action_verb(bullet)
-            action_category = self.categorize_action(action) if action else "other"
-            
-            # Categorize responsibility
-            category = self.categorize_responsibility(bullet)
+            # Action verb, categories and seniority hits
+            action, action_category, category, seniority_hits = self._analyze_bullet(bullet)
+            all_hits.update(seniority_hits)
             
             # Build data
             resp_info = {
@@ -263,7 +371,7 @@ class ResponsibilityTokenizer(BaseTokenizer):
             resp_data.append(resp_info)
             
             if action:
-                action_verbs.append(action)
+                action_verbs[action] = None
             
             # Group by category
             if category not in categorized:
@@ -271,16 +379,16 @@ class ResponsibilityTokenizer(BaseTokenizer):
             categorized[category].append(bullet)
         
         # Detect seniority
-        seniority = self.detect_seniority_indicators(bullets)
+        seniority = self._seniority_counts(all_hits)
         
         # Build result
         result = {
             'responsibilities': resp_data,
             'count': len(resp_data),
             'categorized': categorized,
-            'action_verbs': list(set(action_verbs)),  # Unique verbs
+            'action_verbs': list(action_verbs),  # Unique verbs, first-seen order
             'seniority_indicators': seniority,
-            'original': text[:200] + '...' if len(text) > 200 else text,
+            'original': self.preview(text),
             'metadata': {
                 'has_leadership': seniority['leadership'] > 0,
                 'has_management': seniority['management'] > 0,
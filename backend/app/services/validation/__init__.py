@@ -9,8 +9,21 @@ Date: 2025-12-16
 
 from .skill_validator import SkillValidatorService
 from .queue_manager import QueueManagerService
+from .history_writer import HistoryWriter, history_writer
+from .lookup_cache import (
+    get_all_categories,
+    get_category_by_id,
+    get_category_by_name,
+    get_skill_by_id
+)
 
 __all__ = [
     "SkillValidatorService",
     "QueueManagerService",
+    "HistoryWriter",
+    "history_writer",
+    "get_all_categories",
+    "get_category_by_id",
+    "get_category_by_name",
+    "get_skill_by_id",
 ]
\ No newline at end of file
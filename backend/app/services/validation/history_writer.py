@@ -0,0 +1,144 @@
+# Location: backend/app/services/validation/history_writer.py
+"""
+Validation History Writer
+Module #5: Skill Validation System
+
+Batches skill_validation_history audit rows off the request path.
+Validation endpoints enqueue history entries after their transaction
+commits; a background task drains the queue and writes each batch
+with a single multi-row INSERT. A batch that fails is retried row by
+row so one bad row cannot drop the rest; rows that still fail are
+logged with their values.
+
+Author: Herlambang Haryo Putro
+Date: 2025-12-16
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List
+
+from sqlalchemy import insert
+
+from app.database.session import SessionLocal
+from app.models.validation_history import ValidationHistory
+
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryWriter:
+    """Background batch writer for validation history"""
+
+    def __init__(self, flush_interval: float = 0.1, batch_size: int = 500):
+        """
+        Initialize writer
+
+        Args:
+            flush_interval: Max seconds to wait before flushing a partial batch
+            batch_size: Max rows per INSERT
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Dict[str, Any]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """True when the drain task is active and accepting entries"""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the drain task (call from app startup)"""
+        if self.is_running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Stop the drain task and flush anything still queued"""
+        if not self.is_running:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Let entries enqueued from worker threads land in the queue
+        await asyncio.sleep(0)
+
+        # Flush the partially collected batch plus leftovers
+        batch, self._batch = self._batch, []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await asyncio.to_thread(self._write, batch)
+
+    def enqueue(self, entry: Dict[str, Any]):
+        """
+        Queue a history row for writing
+
+        Safe to call from the event loop or from worker threads.
+
+        Args:
+            entry: Column values keyed by ValidationHistory attribute name
+        """
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, entry)
+
+    async def _run(self):
+        """Drain queue every flush_interval or batch_size rows"""
+        while True:
+            # Collect into self._batch so stop() can flush it if cancelled
+            self._batch.append(await self._queue.get())
+            deadline = self._loop.time() + self.flush_interval
+
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Hand the batch off before awaiting; the thread finishes the
+            # write even if this task is cancelled meanwhile
+            batch, self._batch = self._batch, []
+            await asyncio.to_thread(self._write, batch)
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        """Write one batch in a single INSERT, falling back to row by row"""
+        db = SessionLocal()
+        try:
+            try:
+                db.execute(insert(ValidationHistory), batch)
+                db.commit()
+                return
+            except Exception:
+                db.rollback()
+                logger.exception(
+                    "Failed to write %d validation history rows, retrying one by one",
+                    len(batch)
+                )
+
+            for entry in batch:
+                try:
+                    db.execute(insert(ValidationHistory), [entry])
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    logger.exception("Dropped validation history row: %r", entry)
+        finally:
+            db.close()
+
+
+# Shared instance, started/stopped by app/main.py
+history_writer = HistoryWriter()
@@ -0,0 +1,100 @@
+# Location: backend/app/services/validation/lookup_cache.py
+"""
+Cached Lookups
+Module #5: Skill Validation System
+
+In-process TTL caches for skill_categories (dozens of rows, rarely
+changes) and skills_dictionary lookups by id. Values are plain dicts
+(model.to_dict()) so they outlive the session that loaded them.
+ORM writes to either table clear the matching cache.
+
+stats_cache holds the validation dashboard stats for a few seconds;
+SkillValidatorService clears it on commit.
+
+Author: Herlambang Haryo Putro
+Date: 2025-12-16
+"""
+
+from typing import Optional, Dict, Any, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.skill_category import SkillCategory
+from app.models.skill_dictionary import SkillsDictionary
+from app.services.cache import TTLCache
+
+
+category_cache = TTLCache(ttl=300)
+skill_cache = TTLCache(ttl=300)
+stats_cache = TTLCache(ttl=10)
+
+
+def _load_categories(db: Session) -> Dict[int, Dict[str, Any]]:
+    """Load all categories keyed by id, sorted by sort_order"""
+    categories = category_cache.get('all')
+
+    if categories is None:
+        rows = db.query(SkillCategory).order_by(SkillCategory.sort_order).all()
+        categories = {cat.id: cat.to_dict() for cat in rows}
+        category_cache.set('all', categories)
+
+    return categories
+
+
+def get_all_categories(
+    db: Session,
+    is_active: Optional[bool] = None
+) -> List[Dict[str, Any]]:
+    """Get all categories sorted by sort_order"""
+    categories = _load_categories(db).values()
+
+    if is_active is not None:
+        categories = [cat for cat in categories if cat['is_active'] == is_active]
+
+    return [dict(cat) for cat in categories]
+
+
+def get_category_by_id(db: Session, category_id: int) -> Optional[Dict[str, Any]]:
+    """Get single category by id"""
+    category = _load_categories(db).get(category_id)
+    return dict(category) if category else None
+
+
+def get_category_by_name(db: Session, category_name: str) -> Optional[Dict[str, Any]]:
+    """Get single category by category_name"""
+    for category in _load_categories(db).values():
+        if category['category_name'] == category_name:
+            return dict(category)
+    return None
+
+
+def get_skill_by_id(db: Session, skill_id: int) -> Optional[Dict[str, Any]]:
+    """Get single dictionary skill by id"""
+    skill = skill_cache.get(skill_id)
+
+    if skill is None:
+        row = db.query(SkillsDictionary).filter(
+            SkillsDictionary.id == skill_id
+        ).first()
+        if not row:
+            return None
+        skill = row.to_dict()
+        skill_cache.set(skill_id, skill)
+
+    return dict(skill)
+
+
+# Invalidate on ORM writes
+@event.listens_for(SkillCategory, 'after_insert')
+@event.listens_for(SkillCategory, 'after_update')
+@event.listens_for(SkillCategory, 'after_delete')
+def _clear_category_cache(mapper, connection, target):
+    category_cache.clear()
+
+
+@event.listens_for(SkillsDictionary, 'after_insert')
+@event.listens_for(SkillsDictionary, 'after_update')
+@event.listens_for(SkillsDictionary, 'after_delete')
+def _clear_skill_cache(mapper, connection, target):
+    skill_cache.delete(target.id)
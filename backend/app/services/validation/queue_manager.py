@@ -10,9 +10,9 @@ Date: 2025-12-16
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_
+from sqlalchemy import func, and_, case, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime
 
 from app.models.validation_queue import ValidationQueue
 from app.models.skill_category import SkillCategory
@@ -21,6 +21,9 @@ from app.models.skill_category import SkillCategory
 class QueueManagerService:
     """Service for managing validation queue"""
     
+    # Max ids per IN (...) list in bulk updates
+    ID_CHUNK_SIZE = 1000
+    
     def __init__(self, db: Session):
         """Initialize service with database session"""
         self.db = db
@@ -34,10 +37,14 @@ class QueueManagerService:
         category_id: Optional[int] = None,
         min_priority: Optional[int] = None,
         sort_by: str = 'priority',
-        sort_order: str = 'desc'
-    ) -> Tuple[List[ValidationQueue], int]:
+        sort_order: str = 'desc',
+        include_total: bool = True
+    ) -> Tuple[List[ValidationQueue], Optional[int]]:
         """
         Get queue items with filtering and pagination
+        
+        The total is read from a COUNT(*) OVER () column on the page
+        query; with include_total=False it is skipped and returned as None.
         """
         
         # Build query
@@ -60,9 +67,6 @@ class QueueManagerService:
         if min_priority is not None:
             query = query.filter(ValidationQueue.priority >= min_priority)
         
-        # Get total count
-        total = query.count()
-        
         # Apply sorting
         if sort_by == 'priority':
             order_col = ValidationQueue.priority
@@ -79,9 +83,18 @@ class QueueManagerService:
             query = query.order_by(order_col.asc())
         
         # Apply pagination
-        items = query.offset(skip).limit(limit).all()
+        if not include_total:
+            return query.offset(skip).limit(limit).all(), None
         
-        return items, total
+        rows = query.add_columns(
+            func.count().over().label('total')
+        ).offset(skip).limit(limit).all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        # Page past the end: no row to carry the total
+        return [], query.count() if skip else 0
     
     def get_queue_item(self, queue_id: int) -> Optional[ValidationQueue]:
         """Get single queue item by ID"""
@@ -96,34 +109,51 @@ class QueueManagerService:
     ) -> Optional[ValidationQueue]:
         """
         Get next item to review (highest priority, pending status)
+        
+        With assigned_to, the user's own in-progress item comes first;
+        otherwise the next pending item is locked with FOR UPDATE SKIP
+        LOCKED and claimed, so concurrent reviewers never get the same row.
         """
         
-        query = self.db.query(ValidationQueue).filter(
+        if not assigned_to:
+            # Peek only, nothing to claim
+            return self.db.query(ValidationQueue).filter(
+                ValidationQueue.status == 'pending'
+            ).order_by(
+                ValidationQueue.priority.desc(),
+                ValidationQueue.source_count.desc()
+            ).first()
+        
+        # User's own in-progress item first (no lock needed, it is theirs)
+        current = self.db.query(ValidationQueue).filter(
+            ValidationQueue.status == 'in_progress',
+            ValidationQueue.assigned_to == assigned_to
+        ).order_by(
+            ValidationQueue.priority.desc(),
+            ValidationQueue.source_count.desc()
+        ).first()
+        
+        if current:
+            return current
+        
+        # Next pending item; the plain status + priority order is served by
+        # idx_queue_status_priority, so only the returned row gets locked
+        next_item = self.db.query(ValidationQueue).filter(
             ValidationQueue.status == 'pending'
         ).order_by(
             ValidationQueue.priority.desc(),
             ValidationQueue.source_count.desc()
-        )
+        ).with_for_update(skip_locked=True).first()
         
-        if assigned_to:
-            # Check if user has items in progress
-            in_progress = query.filter(
-                ValidationQueue.status == 'in_progress',
-                ValidationQueue.assigned_to == assigned_to
-            ).first()
-            
-            if in_progress:
-                return in_progress
+        if next_item is None:
+            return None
         
-        # Get next pending item
-        next_item = query.first()
+        next_item.status = 'in_progress'
+        next_item.assigned_to = assigned_to
         
-        if next_item and assigned_to:
-            next_item.status = 'in_progress'
-            next_item.assigned_to = assigned_to
-            next_item.updated_at = datetime.now()
-            self.db.commit()
-            self.db.refresh(next_item)
+        # Commit releases the row lock
+        self.db.commit()
+        self.db.refresh(next_item)
         
         return next_item
     
@@ -132,63 +162,51 @@ class QueueManagerService:
         Get queue statistics
         """
         
-        total = self.db.query(func.count(ValidationQueue.id)).scalar()
-        
-        # By status
-        pending = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'pending'
-        ).scalar()
-        
-        in_progress = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'in_progress'
-        ).scalar()
-        
-        completed = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'completed'
-        ).scalar()
-        
-        skipped = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'skipped'
-        ).scalar()
-        
-        # High priority items
-        high_priority = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.priority >= 50,
-            ValidationQueue.status == 'pending'
-        ).scalar()
-        
-        return {
-            'total': total or 0,
-            'pending': pending or 0,
-            'in_progress': in_progress or 0,
-            'completed': completed or 0,
-            'skipped': skipped or 0,
-            'high_priority': high_priority or 0,
-            'completion_rate': round((completed / total * 100) if total > 0 else 0, 2)
-        }
+        def count_where(*conditions):
+            return func.sum(case((and_(*conditions), 1), else_=0))
+        
+        # All counts in one pass over the table
+        row = self.db.query(
+            func.count(ValidationQueue.id).label('total'),
+            count_where(ValidationQueue.status == 'pending').label('pending'),
+            count_where(ValidationQueue.status == 'in_progress').label('in_progress'),
+            count_where(ValidationQueue.status == 'completed').label('completed'),
+            count_where(ValidationQueue.status == 'skipped').label('skipped'),
+            count_where(
+                ValidationQueue.priority >= 50,
+                ValidationQueue.status == 'pending'
+            ).label('high_priority'),
+        ).one()
+        
+        # SUM is NULL on an empty table and DECIMAL otherwise
+        stats = {key: int(value or 0) for key, value in row._mapping.items()}
+        
+        total = stats['total']
+        stats['completion_rate'] = round((stats['completed'] / total * 100) if total > 0 else 0, 2)
+        
+        return stats
     
     def reset_stuck_items(self, hours: int = 24) -> int:
         """
         Reset items stuck in 'in_progress' status
         """
         
-        from datetime import timedelta
-        threshold = datetime.now() - timedelta(hours=hours)
+        # Threshold in database time, the clock updated_at is set by
+        threshold = func.date_sub(
+            func.now(),
+            text('INTERVAL :hours HOUR').bindparams(hours=int(hours))
+        )
         
-        stuck_items = self.db.query(ValidationQueue).filter(
+        # Single UPDATE; rowcount is the number of rows reset
+        count = self.db.query(ValidationQueue).filter(
             ValidationQueue.status == 'in_progress',
             ValidationQueue.updated_at < threshold
-        ).all()
+        ).update({
+            ValidationQueue.status: 'pending',
+            ValidationQueue.assigned_to: None,
+        }, synchronize_session=False)
         
-        count = 0
-        for item in stuck_items:
-            item.status = 'pending'
-            item.assigned_to = None
-            item.updated_at = datetime.now()
-            count += 1
-        
-        if count > 0:
-            self.db.commit()
+        self.db.commit()
         
         return count
     
@@ -197,20 +215,17 @@ class QueueManagerService:
         Recalculate priority based on source_count
         """
         
-        items = self.db.query(ValidationQueue).filter(
-            ValidationQueue.status == 'pending'
-        ).all()
+        new_priority = func.least(ValidationQueue.source_count, 100)
         
-        count = 0
-        for item in items:
-            new_priority = min(item.source_count, 100)
-            if new_priority != item.priority:
-                item.priority = new_priority
-                item.updated_at = datetime.now()
-                count += 1
+        # Single UPDATE touching only rows whose priority changes
+        count = self.db.query(ValidationQueue).filter(
+            ValidationQueue.status == 'pending',
+            ValidationQueue.priority.is_distinct_from(new_priority)
+        ).update({
+            ValidationQueue.priority: new_priority,
+        }, synchronize_session=False)
         
-        if count > 0:
-            self.db.commit()
+        self.db.commit()
         
         return count
     
@@ -226,22 +241,9 @@ class QueueManagerService:
         Add new item to queue
         """
         
-        # Check if already exists
-        existing = self.db.query(ValidationQueue).filter(
-            ValidationQueue.skill_name == skill_name
-        ).first()
-        
-        if existing:
-            # Update count
-            existing.source_count += source_count
-            existing.priority = min(existing.source_count, 100)
-            existing.updated_at = datetime.now()
-            self.db.commit()
-            self.db.refresh(existing)
-            return existing
-        
-        # Create new
-        queue_item = ValidationQueue(
+        # Insert or bump source_count in one statement
+        # (relies on the unique constraint on skill_name)
+        stmt = mysql_insert(ValidationQueue).values(
             skill_name=skill_name,
             source_count=source_count,
             priority=priority or min(source_count, 100),
@@ -249,12 +251,22 @@ class QueueManagerService:
             suggested_category_id=suggested_category_id,
             context_sample=context_sample
         )
+        new_count = ValidationQueue.source_count + stmt.inserted.source_count
         
-        self.db.add(queue_item)
+        # MySQL applies assignments left to right, so priority is set
+        # before source_count changes
+        stmt = stmt.on_duplicate_key_update([
+            ('priority', func.least(new_count, 100)),
+            ('source_count', new_count),
+            ('updated_at', func.now()),
+        ])
+        
+        self.db.execute(stmt)
         self.db.commit()
-        self.db.refresh(queue_item)
         
-        return queue_item
+        return self.db.query(ValidationQueue).filter(
+            ValidationQueue.skill_name == skill_name
+        ).first()
     
     def bulk_update_status(
         self,
@@ -265,19 +277,22 @@ class QueueManagerService:
         Update status for multiple items
         """
         
-        items = self.db.query(ValidationQueue).filter(
-            ValidationQueue.id.in_(queue_ids)
-        ).all()
+        if not queue_ids:
+            return 0
+        
+        # updated_at is set by ON UPDATE CURRENT_TIMESTAMP
+        values = {ValidationQueue.status: new_status}
+        if new_status == 'completed':
+            values[ValidationQueue.completed_at] = func.now()
         
+        # One UPDATE per chunk of ids, committed together; rowcount is
+        # the number of matched ids
         count = 0
-        for item in items:
-            item.status = new_status
-            item.updated_at = datetime.now()
-            if new_status == 'completed':
-                item.completed_at = datetime.now()
-            count += 1
-        
-        if count > 0:
-            self.db.commit()
+        for i in range(0, len(queue_ids), self.ID_CHUNK_SIZE):
+            count += self.db.query(ValidationQueue).filter(
+                ValidationQueue.id.in_(queue_ids[i:i + self.ID_CHUNK_SIZE])
+            ).update(values, synchronize_session=False)
+        
+        self.db.commit()
         
         return count
\ No newline at end of file
@@ -10,14 +10,16 @@ Date: 2025-12-16
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, and_, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from app.models.skill_dictionary import SkillsDictionary
 from app.models.validation_queue import ValidationQueue
 from app.models.validation_history import ValidationHistory
-from app.models.skill_category import SkillCategory
+from app.services.validation.history_writer import history_writer
+from app.services.validation.lookup_cache import get_all_categories, skill_cache, stats_cache
 
 
 class SkillValidatorService:
@@ -26,62 +28,94 @@ class SkillValidatorService:
     def __init__(self, db: Session):
         """Initialize service with database session"""
         self.db = db
+        self._pending_history: List[Dict[str, Any]] = []
+    
+    def _record_history(self, **entry) -> None:
+        """
+        Record a history row for the current transaction
+        
+        Rows are held until _commit: handed to the background writer
+        after commit when it is running, otherwise written in one
+        multi-row INSERT inside the transaction
+        """
+        if history_writer.is_running:
+            # Stamp now; the batched INSERT may run a moment later
+            entry.setdefault('created_at', datetime.now())
+        self._pending_history.append(entry)
+    
+    def _commit(self) -> None:
+        """Commit, writing or releasing queued history rows"""
+        if self._pending_history and not history_writer.is_running:
+            self.db.execute(insert(ValidationHistory), self._pending_history)
+            self._pending_history.clear()
+        
+        self.db.commit()
+        stats_cache.clear()
+        
+        if not self._pending_history:
+            return
+        
+        if history_writer.is_running:
+            for entry in self._pending_history:
+                history_writer.enqueue(entry)
+        else:
+            # Writer stopped after the rows were recorded; write them here
+            self.db.execute(insert(ValidationHistory), self._pending_history)
+            self.db.commit()
+        self._pending_history.clear()
     
     def approve_skill(
         self,
         queue_item: ValidationQueue,
         category_id: Optional[int] = None,
         validator_user: str = "system",
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        commit: bool = True
     ) -> SkillsDictionary:
         """
         Approve a skill from validation queue
         
-        Creates entry in skills_dictionary, updates queue status,
-        and logs to history
+        Creates or updates the skills_dictionary entry, updates queue
+        status, and logs to history. With commit=False the caller
+        commits.
         """
         
-        # Check if skill already exists in dictionary
-        existing = self.db.query(SkillsDictionary).filter(
-            SkillsDictionary.skill_name == queue_item.skill_name
-        ).first()
+        # Insert or update the dictionary entry in one statement
+        # (relies on the unique constraint on skill_name)
+        stmt = mysql_insert(SkillsDictionary).values(
+            skill_name=queue_item.skill_name,
+            normalized_name=queue_item.skill_name.lower().strip(),
+            category_id=category_id or queue_item.suggested_category_id,
+            is_validated=True,
+            is_active=True,
+            validation_status='approved',
+            confidence_score=queue_item.confidence_score,
+            usage_count=queue_item.source_count
+        )
         
-        if existing:
-            # Update existing
-            existing.is_validated = True
-            existing.validation_status = 'approved'
-            if category_id:
-                old_category = existing.category_id
-                existing.category_id = category_id
-            existing.usage_count = queue_item.source_count
-            existing.updated_at = datetime.now()
-            
-            skill = existing
-        else:
-            # Create new
-            skill = SkillsDictionary(
-                skill_name=queue_item.skill_name,
-                normalized_name=queue_item.skill_name.lower().strip(),
-                category_id=category_id or queue_item.suggested_category_id,
-                is_validated=True,
-                is_active=True,
-                validation_status='approved',
-                confidence_score=queue_item.confidence_score,
-                usage_count=queue_item.source_count
-            )
-            self.db.add(skill)
+        # LAST_INSERT_ID(id) makes lastrowid the existing row's id on update
+        updates = [
+            ('id', func.last_insert_id(SkillsDictionary.id)),
+            ('is_validated', True),
+            ('validation_status', 'approved'),
+            ('usage_count', stmt.inserted.usage_count),
+            ('updated_at', func.now()),
+        ]
+        if category_id:
+            updates.append(('category_id', category_id))
+        
+        skill_id = self.db.execute(stmt.on_duplicate_key_update(updates)).lastrowid
+        
+        # Core statements skip the ORM events that clear the cache
+        skill_cache.delete(skill_id)
         
         # Update queue status
         queue_item.status = 'completed'
-        queue_item.completed_at = datetime.now()
-        queue_item.updated_at = datetime.now()
-        
-        # Flush to get skill.id
-        self.db.flush()
+        queue_item.completed_at = func.now()
         
         # Log to history
-        history = ValidationHistory(
-            skill_id=skill.id,
+        self._record_history(
+            skill_id=skill_id,
             validator_user=validator_user,
             action='approved',
             old_category_id=None,
@@ -89,42 +123,63 @@ class SkillValidatorService:
             old_status='pending',
             new_status='approved',
             notes=notes,
-            metadata={
+            history_metadata={
                 'queue_id': queue_item.id,
                 'source_count': queue_item.source_count
             }
         )
-        self.db.add(history)
         
-        self.db.commit()
-        self.db.refresh(skill)
+        if commit:
+            self._commit()
         
-        return skill
+        # populate_existing reloads a row already in the session
+        return self.db.get(SkillsDictionary, skill_id, populate_existing=True)
     
     def reject_skill(
         self,
         queue_item: ValidationQueue,
         validator_user: str = "system",
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        commit: bool = True,
+        skills_by_name: Optional[Dict[str, SkillsDictionary]] = None
     ) -> Dict[str, Any]:
         """
         Reject a skill from validation queue
         
-        Marks as rejected, updates queue, logs to history
+        Marks as rejected, updates queue, logs to history.
+        With commit=False the caller commits. skills_by_name is a
+        prefetched {skill_name: row} map used instead of the lookup.
         """
         
-        # Check if exists in dictionary
-        existing = self.db.query(SkillsDictionary).filter(
-            SkillsDictionary.skill_name == queue_item.skill_name
-        ).first()
+        rejected_values = {
+            'is_validated': True,
+            'is_active': False,
+            'validation_status': 'rejected'
+        }
+        
+        # Check if exists in dictionary; only the id is needed
+        if skills_by_name is not None:
+            existing = skills_by_name.get(queue_item.skill_name)
+            skill_id = existing.id if existing else None
+        else:
+            existing = None
+            skill_id = self.db.execute(
+                select(SkillsDictionary.id).where(
+                    SkillsDictionary.skill_name == queue_item.skill_name
+                )
+            ).scalar()
         
         if existing:
-            # Update to rejected
-            skill_id = existing.id
-            existing.is_validated = True
-            existing.is_active = False
-            existing.validation_status = 'rejected'
-            existing.updated_at = datetime.now()
+            # Update prefetched row to rejected
+            for key, value in rejected_values.items():
+                setattr(existing, key, value)
+        elif skill_id is not None:
+            # Update to rejected in one statement, no row load
+            self.db.query(SkillsDictionary).filter(
+                SkillsDictionary.id == skill_id
+            ).update(rejected_values)
+            # Core statements skip the ORM events that clear the cache
+            skill_cache.delete(skill_id)
         else:
             # Create as rejected
             skill = SkillsDictionary(
@@ -135,27 +190,28 @@ class SkillValidatorService:
                 validation_status='rejected'
             )
             self.db.add(skill)
+            if skills_by_name is not None:
+                skills_by_name[skill.skill_name] = skill
             self.db.flush()
             skill_id = skill.id
         
         # Update queue
         queue_item.status = 'completed'
-        queue_item.completed_at = datetime.now()
-        queue_item.updated_at = datetime.now()
+        queue_item.completed_at = func.now()
         
         # Log to history
-        history = ValidationHistory(
+        self._record_history(
             skill_id=skill_id,
             validator_user=validator_user,
             action='rejected',
             old_status='pending',
             new_status='rejected',
             notes=notes,
-            metadata={'queue_id': queue_item.id}
+            history_metadata={'queue_id': queue_item.id}
         )
-        self.db.add(history)
         
-        self.db.commit()
+        if commit:
+            self._commit()
         
         return {
             'skill_id': skill_id,
@@ -166,16 +222,17 @@ class SkillValidatorService:
     def skip_skill(
         self,
         queue_item: ValidationQueue,
-        validator_user: str = "system"
+        validator_user: str = "system",
+        commit: bool = True
     ) -> Dict[str, Any]:
         """
-        Skip a skill for later review
+        Skip a skill for later review (with commit=False the caller commits)
         """
         
         queue_item.status = 'skipped'
-        queue_item.updated_at = datetime.now()
         
-        self.db.commit()
+        if commit:
+            self._commit()
         
         return {
             'queue_id': queue_item.id,
@@ -192,6 +249,11 @@ class SkillValidatorService:
     ) -> Dict[str, Any]:
         """
         Validate multiple skills at once
+        
+        The whole batch is one transaction with a SAVEPOINT per item:
+        a failing item is rolled back on its own and reported, the
+        rest are committed together at the end. Skips only touch the
+        queue row and are applied with a single UPDATE.
         """
         
         results = {
@@ -201,57 +263,112 @@ class SkillValidatorService:
             'details': []
         }
         
+        # Claim queue rows in one query; rows another transaction is
+        # validating are skipped instead of waited on
+        queue_by_id = {
+            item.id: item
+            for item in self.db.query(ValidationQueue).filter(
+                ValidationQueue.id.in_(set(queue_ids))
+            ).with_for_update(skip_locked=True)
+        }
+        
+        # Tell locked rows apart from missing ones (plain read, no lock)
+        unclaimed = set(queue_ids) - queue_by_id.keys()
+        locked_ids = set()
+        if unclaimed:
+            locked_ids = {
+                row.id
+                for row in self.db.query(ValidationQueue.id).filter(
+                    ValidationQueue.id.in_(unclaimed)
+                )
+            }
+        
+        # Dictionary rows for rejects
+        
+        skills_by_name = None
+        if action == 'reject' and queue_by_id:
+            skills_by_name = {
+                skill.skill_name: skill
+                for skill in self.db.query(SkillsDictionary).filter(
+                    SkillsDictionary.skill_name.in_(
+                        {item.skill_name for item in queue_by_id.values()}
+                    )
+                )
+            }
+        
+        skip_ids = []
+        
         for queue_id in queue_ids:
+            queue_item = queue_by_id.get(queue_id)
+            
+            if not queue_item:
+                results['failed'] += 1
+                results['details'].append({
+                    'queue_id': queue_id,
+                    'success': False,
+                    'error': (
+                        'Queue item is being validated by another request'
+                        if queue_id in locked_ids else 'Queue item not found'
+                    )
+                })
+                continue
+            
+            if action == 'skip':
+                skip_ids.append(queue_id)
+                results['succeeded'] += 1
+                results['details'].append({
+                    'queue_id': queue_id,
+                    'success': True,
+                    'skill_name': queue_item.skill_name,
+                    'status': 'skipped'
+                })
+                continue
+            
+            # Queued history must drop with a rolled back item
+            history_mark = len(self._pending_history)
+            savepoint = self.db.begin_nested()
+            
             try:
-                queue_item = self.db.query(ValidationQueue).filter(
-                    ValidationQueue.id == queue_id
-                ).first()
-                
-                if not queue_item:
-                    results['failed'] += 1
-                    results['details'].append({
-                        'queue_id': queue_id,
-                        'success': False,
-                        'error': 'Queue item not found'
-                    })
-                    continue
-                
                 if action == 'approve':
                     skill = self.approve_skill(
                         queue_item,
                         category_id=category_id,
-                        validator_user=validator_user
+                        validator_user=validator_user,
+                        commit=False
                     )
-                    results['succeeded'] += 1
-                    results['details'].append({
+                    detail = {
                         'queue_id': queue_id,
                         'skill_id': skill.id,
                         'skill_name': skill.skill_name,
                         'success': True
-                    })
+                    }
                 
                 elif action == 'reject':
                     result = self.reject_skill(
                         queue_item,
-                        validator_user=validator_user
+                        validator_user=validator_user,
+                        commit=False,
+                        skills_by_name=skills_by_name
                     )
-                    results['succeeded'] += 1
-                    results['details'].append({
-                        'queue_id': queue_id,
-                        'success': True,
-                        **result
-                    })
+                    detail = {'queue_id': queue_id, 'success': True, **result}
                 
-                elif action == 'skip':
-                    result = self.skip_skill(queue_item, validator_user)
-                    results['succeeded'] += 1
-                    results['details'].append({
-                        'queue_id': queue_id,
-                        'success': True,
-                        **result
-                    })
+                else:
+                    savepoint.commit()
+                    continue
+                
+                savepoint.commit()
+                results['succeeded'] += 1
+                results['details'].append(detail)
             
             except Exception as e:
+                savepoint.rollback()
+                del self._pending_history[history_mark:]
+                
+                # Rows created in the rolled back savepoint are gone
+                skill = skills_by_name.get(queue_item.skill_name) if skills_by_name is not None else None
+                if skill is not None and skill not in self.db:
+                    del skills_by_name[queue_item.skill_name]
+                
                 results['failed'] += 1
                 results['details'].append({
                     'queue_id': queue_id,
@@ -259,47 +376,70 @@ class SkillValidatorService:
                     'error': str(e)
                 })
         
+        if skip_ids:
+            self.db.query(ValidationQueue).filter(
+                ValidationQueue.id.in_(skip_ids)
+            ).update({ValidationQueue.status: 'skipped'}, synchronize_session=False)
+        
+        self._commit()
+        
         return results
     
     def get_validation_stats(self) -> Dict[str, Any]:
         """
         Get validation statistics for dashboard
+        
+        Cached per process for stats_cache.ttl seconds; commits made
+        through this service clear it
         """
+        stats = stats_cache.get('stats')
+        
+        if stats is None:
+            stats = self._compute_validation_stats()
+            stats_cache.set('stats', stats)
         
-        # Dictionary stats
-        total_skills = self.db.query(func.count(SkillsDictionary.id)).scalar()
-        validated = self.db.query(func.count(SkillsDictionary.id)).filter(
-            SkillsDictionary.is_validated == True
-        ).scalar()
-        pending = self.db.query(func.count(SkillsDictionary.id)).filter(
-            SkillsDictionary.validation_status == 'pending'
-        ).scalar()
-        rejected = self.db.query(func.count(SkillsDictionary.id)).filter(
-            SkillsDictionary.validation_status == 'rejected'
-        ).scalar()
-        
-        # Queue stats
-        total_queue = self.db.query(func.count(ValidationQueue.id)).scalar()
-        queue_pending = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'pending'
-        ).scalar()
-        queue_completed = self.db.query(func.count(ValidationQueue.id)).filter(
-            ValidationQueue.status == 'completed'
-        ).scalar()
-        
-        # Category stats
-        total_categories = self.db.query(func.count(SkillCategory.id)).scalar()
-        active_categories = self.db.query(func.count(SkillCategory.id)).filter(
-            SkillCategory.is_active == True
-        ).scalar()
-        
-        # Recent activity
-        recent_history = self.db.query(ValidationHistory).order_by(
-            ValidationHistory.created_at.desc()
-        ).limit(10).all()
-        
-        # Calculate validation rate
-        validation_rate = (validated / total_skills * 100) if total_skills > 0 else 0
+        return dict(stats)
+    
+    def _compute_validation_stats(self) -> Dict[str, Any]:
+        """Run the dashboard statistics queries"""
+        
+        def count_where(*conditions):
+            return func.sum(case((and_(*conditions), 1), else_=0))
+        
+        # Dictionary stats and validation rate, one pass over the table
+        total_expr = func.count(SkillsDictionary.id)
+        validated_expr = count_where(SkillsDictionary.is_validated == True)
+        dictionary = self.db.query(
+            total_expr,
+            validated_expr,
+            count_where(SkillsDictionary.validation_status == 'pending'),
+            count_where(SkillsDictionary.validation_status == 'rejected'),
+            # NULL (no skills yet) instead of a division by zero
+            validated_expr * 100.0 / func.nullif(total_expr, 0),
+        ).one()
+        # SUM is NULL on an empty table and DECIMAL otherwise
+        total_skills, validated, pending, rejected = (int(v or 0) for v in dictionary[:4])
+        validation_rate = float(dictionary[4] or 0)
+        
+        # Queue stats, one pass over the table
+        queue = self.db.query(
+            func.count(ValidationQueue.id),
+            count_where(ValidationQueue.status == 'pending'),
+            count_where(ValidationQueue.status == 'completed'),
+        ).one()
+        total_queue, queue_pending, queue_completed = (int(v or 0) for v in queue)
+        
+        # Category stats from the cached category list
+        categories = get_all_categories(self.db)
+        total_categories = len(categories)
+        active_categories = sum(1 for cat in categories if cat['is_active'])
+        
+        # Recent activity as plain rows; table column keys match to_dict()
+        recent_history = self.db.execute(
+            select(ValidationHistory.__table__).order_by(
+                ValidationHistory.created_at.desc()
+            ).limit(10)
+        ).mappings().all()
         
         return {
             'total_skills': total_skills or 0,
@@ -312,7 +452,10 @@ class SkillValidatorService:
             'queue_completed': queue_completed or 0,
             'total_categories': total_categories or 0,
             'active_categories': active_categories or 0,
-            'recent_activity': [h.to_dict() for h in recent_history]
+            'recent_activity': [
+                {**row, 'created_at': row['created_at'].isoformat() if row['created_at'] else None}
+                for row in recent_history
+            ]
         }
     
     def update_skill_category(
@@ -335,10 +478,9 @@ class SkillValidatorService:
         
         old_category = skill.category_id
         skill.category_id = new_category_id
-        skill.updated_at = datetime.now()
         
         # Log to history
-        history = ValidationHistory(
+        self._record_history(
             skill_id=skill_id,
             validator_user=validator_user,
             action='updated',
@@ -346,9 +488,8 @@ class SkillValidatorService:
             new_category_id=new_category_id,
             notes=notes
         )
-        self.db.add(history)
         
-        self.db.commit()
-        self.db.refresh(skill)
+        # Commit expires skill; it reloads on first attribute access
+        self._commit()
         
         return skill
\ No newline at end of file
@@ -15,6 +15,18 @@ print()
 print(f"Current Directory: {os.getcwd()}")
 print()
 
+def list_entries(paths):
+    """Existing paths among `paths`, reading each parent directory once"""
+    present = set()
+    for parent in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(parent or ".") as entries:
+                present.update(os.path.join(parent, entry.name).replace("\\", "/") for entry in entries)
+        except OSError:
+            pass
+    return present
+
+
 # Check if app folder exists
 print("Checking folders...")
 folders_to_check = [
@@ -30,8 +42,10 @@ folders_to_check = [
     "app/utils",
 ]
 
+present = list_entries(folders_to_check)
+
 for folder in folders_to_check:
-    exists = "✓" if os.path.exists(folder) else "✗"
+    exists = "✓" if folder in present else "✗"
     print(f"  {exists} {folder}")
 
 print()
@@ -47,8 +61,10 @@ files_to_check = [
     "app/database/session.py",
 ]
 
+present |= list_entries(files_to_check)
+
 for file in files_to_check:
-    exists = "✓" if os.path.exists(file) else "✗"
+    exists = "✓" if file in present else "✗"
     print(f"  {exists} {file}")
 
 print()
@@ -89,13 +105,13 @@ print("=" * 60)
 print("Recommendations:")
 print("=" * 60)
 
-if not os.path.exists("app"):
+if "app" not in present:
     print("❌ 'app' folder not found!")
     print("   → Create folder structure or ensure you're in the correct directory")
-elif not os.path.exists("app/__init__.py"):
+elif "app/__init__.py" not in present:
     print("❌ 'app/__init__.py' not found!")
     print("   → Create empty __init__.py file in app folder")
-elif not os.path.exists("app/main.py"):
+elif "app/main.py" not in present:
     print("❌ 'app/main.py' not found!")
     print("   → Create main.py file with FastAPI app")
 else:
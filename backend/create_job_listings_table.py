@@ -3,6 +3,8 @@ Script untuk membuat database tables
 Run: python create_job_listings_table.py
 """
 
+from sqlalchemy import inspect
+
 from app.database.base import Base
 from app.database.session import engine
 
@@ -16,7 +18,12 @@ print()
 
 print("Creating tables...")
 try:
-    Base.metadata.create_all(bind=engine)
+    # One table-list query instead of a has_table check per table;
+    # tables that already exist are left alone
+    existing = set(inspect(engine).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn, tables=missing, checkfirst=False)
     print("✓ Tables created successfully!")
     print()
     
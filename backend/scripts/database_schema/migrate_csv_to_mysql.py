@@ -28,6 +28,9 @@ from dotenv import load_dotenv
 # Load environment
 load_dotenv()
 
+# Angka dengan pemisah titik/koma, e.g. "5.000.000"
+_NUM_RE = re.compile(r'(\d+(?:[.,]\d+)*)')
+
 # Colors for output
 class Colors:
     HEADER = '\033[95m'
@@ -60,6 +63,16 @@ def print_warning(text):
 class CSVMigrator:
     """Class untuk handle CSV to MySQL migration"""
     
+    # Encodings to try, in order
+    ENCODINGS = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
+    
+    # Rows per read_csv chunk; bounds memory regardless of file size
+    CHUNK_SIZE = 50_000
+    
+    # tanggal_posting (DATE) and waktu_scraping (DATETIME) formats, in order
+    DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d']
+    DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']
+    
     def __init__(self, data_dir: str = "data/raw/lokerid"):
         self.data_dir = Path(data_dir)
         self.engine = engine
@@ -84,9 +97,7 @@ class CSVMigrator:
         
         salary_text = str(salary_text).strip()
         
-        # Pattern untuk angka dengan pemisah titik/koma
-        pattern = r'(\d+(?:[.,]\d+)*)'
-        matches = re.findall(pattern, salary_text)
+        matches = _NUM_RE.findall(salary_text)
         
         if not matches:
             return None, None, 'IDR'
@@ -103,12 +114,14 @@ class CSVMigrator:
         if not numbers:
             return None, None, 'IDR'
         
+        lower = salary_text.lower()
+        
         # Jika ada kata "juta" atau "million", multiply by 1,000,000
-        if 'juta' in salary_text.lower() or 'million' in salary_text.lower():
+        if 'juta' in lower or 'million' in lower:
             numbers = [n * 1_000_000 if n < 1000 else n for n in numbers]
         
         # Jika ada kata "ribu" atau "thousand", multiply by 1,000
-        if 'ribu' in salary_text.lower() or 'thousand' in salary_text.lower():
+        if 'ribu' in lower or 'thousand' in lower:
             numbers = [n * 1_000 if n < 100 else n for n in numbers]
         
         # Get min and max
@@ -117,59 +130,45 @@ class CSVMigrator:
         
         return salary_min, salary_max, 'IDR'
     
-    def parse_date(self, date_text):
-        """Parse tanggal_posting ke format DATE"""
-        if not date_text or pd.isna(date_text):
-            return None
-        
-        # Jika sudah datetime
-        if isinstance(date_text, datetime):
-            return date_text.date()
-        
-        # Coba parse string
-        try:
-            # Format: YYYY-MM-DD atau DD/MM/YYYY
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d']:
-                try:
-                    return datetime.strptime(str(date_text), fmt).date()
-                except ValueError:
-                    continue
-        except:
-            pass
+    def parse_datetimes(self, values, formats):
+        """
+        Parse a column of date/time text, trying formats in order
         
-        return None
-    
-    def parse_scraping_time(self, time_text):
-        """Parse waktu_scraping ke format DATETIME"""
-        if not time_text or pd.isna(time_text):
-            return None
+        One pd.to_datetime call per format over the rows still unparsed,
+        matching datetime.strptime with the first format that fits;
+        NaT where none does
+        """
+        # Work on positions so any index (duplicates, chunk offsets) is fine
+        text = pd.Series(values.to_numpy(dtype=object))
+        text = text.where(text.notna(), '').astype(str)
         
-        # Jika sudah datetime
-        if isinstance(time_text, datetime):
-            return time_text
+        parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[us]')
         
-        # Coba parse string
-        try:
-            # Format: YYYY-MM-DD HH:MM:SS
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']:
-                try:
-                    return datetime.strptime(str(time_text), fmt)
-                except ValueError:
-                    continue
-        except:
-            pass
+        for fmt in formats:
+            todo = text[parsed.isna() & (text != '')]
+            if todo.empty:
+                break
+            
+            # Inputs pandas accepts but strptime rejects
+            if '%S' in fmt:
+                # Leap seconds (pandas rolls them into the next minute)
+                todo = todo[~todo.str.contains(r':6[01](?:\.\d*)?$')]
+            if '%f' in fmt:
+                # More than 6 fraction digits (pandas takes up to 9)
+                todo = todo[~todo.str.contains(r'\.\d{7}')]
+            
+            parsed[todo.index] = pd.to_datetime(todo, format=fmt, errors='coerce')
         
-        return None
+        return pd.Series(parsed.to_numpy(), index=values.index)
     
     def clean_text(self, text):
         """Clean text data"""
         if pd.isna(text):
             return None
         
-        text = str(text).strip()
-        
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
+        # Strip and replace whitespace runs with a single space; split()
+        # uses the same whitespace set as \s and is much faster than re.sub
+        text = ' '.join(str(text).split())
         
         # Keep most characters, just remove problematic ones
         # text = re.sub(r'[^\w\s.,;:!?()-]', '', text)
@@ -228,15 +227,22 @@ class CSVMigrator:
         
         for col in text_columns:
             if col in df.columns:
-                df[col] = df[col].apply(self.clean_text)
+                # Clean each distinct value once (lokasi, level, fungsi...
+                # repeat heavily) and map the results back
+                values = df[col]
+                cleaned = {value: self.clean_text(value) for value in values.dropna().unique()}
+                df[col] = values.map(cleaned)
         
         # Parse salary
         print_info("Parsing salary data...")
         if 'gaji' in df.columns:
-            salary_data = df['gaji'].apply(self.parse_salary)
-            df['gaji_min'] = salary_data.apply(lambda x: x[0])
-            df['gaji_max'] = salary_data.apply(lambda x: x[1])
-            df['gaji_currency'] = salary_data.apply(lambda x: x[2])
+            # Salary text repeats a lot ("Rp 4 - 6 Juta"), so parse each
+            # distinct value once and map the results back onto the column
+            salaries = df['gaji']
+            parsed = {value: self.parse_salary(value) for value in salaries.dropna().unique()}
+            df['gaji_min'] = salaries.map({value: p[0] for value, p in parsed.items()})
+            df['gaji_max'] = salaries.map({value: p[1] for value, p in parsed.items()})
+            df['gaji_currency'] = 'IDR'
         else:
             df['gaji_min'] = None
             df['gaji_max'] = None
@@ -245,10 +251,14 @@ class CSVMigrator:
         # Parse dates
         print_info("Parsing dates...")
         if 'tanggal_posting' in df.columns:
-            df['tanggal_posting'] = df['tanggal_posting'].apply(self.parse_date)
+            df['tanggal_posting'] = self.parse_datetimes(
+                df['tanggal_posting'], self.DATE_FORMATS
+            ).dt.date
         
         if 'waktu_scraping' in df.columns:
-            df['waktu_scraping'] = df['waktu_scraping'].apply(self.parse_scraping_time)
+            df['waktu_scraping'] = self.parse_datetimes(
+                df['waktu_scraping'], self.DATETIME_FORMATS
+            )
         
         # Add processing flags
         df['is_processed'] = False
@@ -311,35 +321,32 @@ class CSVMigrator:
         
         print_info(f"Inserting {total_rows} rows in batches of {batch_size}...")
         
+        # Build INSERT query once, with PyMySQL's positional placeholders
+        # so rows can be passed as plain tuples
+        columns = list(df.columns)
+        placeholders = ', '.join(['%s'] * len(columns))
+        columns_str = ', '.join(columns)
+        
+        query = f"""
+            INSERT INTO jobs ({columns_str})
+            VALUES ({placeholders})
+        """
+        
+        # NaN/NaT -> None for the whole frame in one pass
+        df = df.astype(object).where(df.notna(), None)
+        
         # Insert in batches
         for i in range(0, total_rows, batch_size):
             batch = df.iloc[i:i+batch_size]
             
             try:
-                # Convert to dict records
-                records = batch.to_dict('records')
-                
-                # Build INSERT query
-                columns = list(records[0].keys())
-                placeholders = ', '.join([f':{col}' for col in columns])
-                columns_str = ', '.join(columns)
-                
-                query = text(f"""
-                    INSERT INTO jobs ({columns_str})
-                    VALUES ({placeholders})
-                """)
-                
-                # Execute batch
-                for record in records:
-                    # Convert None to NULL-compatible values
-                    cleaned_record = {
-                        k: (None if pd.isna(v) else v) 
-                        for k, v in record.items()
-                    }
-                    db.execute(query, cleaned_record)
+                # One executemany per batch straight from row tuples (no
+                # per-row dicts); PyMySQL sends it as a multi-row INSERT
+                rows = list(batch.itertuples(index=False, name=None))
+                db.connection().exec_driver_sql(query, rows)
                 
                 db.commit()
-                self.stats['successful'] += len(records)
+                self.stats['successful'] += len(rows)
                 
                 # Progress indicator
                 progress = min(i + batch_size, total_rows)
@@ -353,6 +360,25 @@ class CSVMigrator:
         print()  # New line after progress
         print_success(f"Inserted {self.stats['successful']} rows")
     
+    def detect_encoding(self, file_path: Path):
+        """
+        First encoding in ENCODINGS that decodes the whole file
+        
+        Decoded in blocks, so the file is never held in memory; checked
+        up front because a bad byte found mid-stream would come after
+        earlier chunks were already inserted
+        """
+        for encoding in self.ENCODINGS:
+            try:
+                with open(file_path, encoding=encoding) as f:
+                    while f.read(1 << 20):
+                        pass
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        
+        return None
+    
     def process_file(self, file_path: Path, db: Session):
         """Process single CSV file"""
         print_header(f"Processing: {file_path.name}")
@@ -361,36 +387,41 @@ class CSVMigrator:
             # Read CSV
             print_info("Reading CSV file...")
             
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
-            df = None
+            encoding = self.detect_encoding(file_path)
             
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    print_info(f"Successfully read with encoding: {encoding}")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if df is None:
+            if encoding is None:
                 raise Exception("Could not read CSV with any encoding")
             
-            initial_rows = len(df)
-            self.stats['total_rows'] += initial_rows
-            print_info(f"Read {initial_rows} rows")
+            print_info(f"Successfully read with encoding: {encoding}")
             
-            # Process DataFrame
-            df = self.process_dataframe(df, file_path.name)
+            # Stream the file in chunks: process -> dedupe -> insert each
+            # chunk before reading the next. dtype=str keeps every chunk's
+            # columns typed the same way, whatever values it happens to hold
+            reader = pd.read_csv(
+                file_path,
+                encoding=encoding,
+                dtype=str,
+                chunksize=self.CHUNK_SIZE
+            )
             
-            # Check duplicates
-            df = self.check_duplicates(df, db)
+            read_rows = 0
+            for df in reader:
+                read_rows += len(df)
+                self.stats['total_rows'] += len(df)
+                
+                # Process DataFrame
+                df = self.process_dataframe(df, file_path.name)
+                
+                # Check duplicates
+                df = self.check_duplicates(df, db)
+                
+                # Insert to database
+                if len(df) > 0:
+                    self.insert_to_database(df, db)
+                else:
+                    print_warning("All rows were duplicates, nothing to insert")
             
-            # Insert to database
-            if len(df) > 0:
-                self.insert_to_database(df, db)
-            else:
-                print_warning("All rows were duplicates, nothing to insert")
+            print_info(f"Read {read_rows} rows")
             
             self.stats['files_processed'] += 1
             print_success(f"File {file_path.name} processed successfully")
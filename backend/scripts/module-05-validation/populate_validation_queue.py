@@ -132,8 +132,9 @@ def populate_queue(
             continue
         
         # Check if already in queue
+        # Index-only probe on the uq_queue_skill_name unique key
         check = db.execute(
-            text("SELECT id FROM validation_queue WHERE skill_name = :skill"),
+            text("SELECT 1 FROM validation_queue WHERE skill_name = :skill LIMIT 1"),
             {'skill': skill}
         )
         
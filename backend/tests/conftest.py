@@ -0,0 +1,35 @@
+# Location: backend/tests/conftest.py
+"""
+Shared test fixtures
+
+Tests that rely on MySQL behaviour (JSON_TABLE, upserts, SKIP LOCKED)
+run against a scratch MySQL 8 database given by TEST_DATABASE_URL and
+are skipped when it is not set. Tables are created per test and
+dropped afterwards, so never point it at a real database.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+
+
+@pytest.fixture
+def mysql_engine():
+    """Engine for the scratch MySQL database"""
+    if not TEST_DATABASE_URL:
+        pytest.skip('TEST_DATABASE_URL not set (needs a scratch MySQL 8 database)')
+
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def mysql_session_factory(mysql_engine):
+    """sessionmaker bound to the scratch MySQL database"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=mysql_engine)
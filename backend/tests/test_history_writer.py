@@ -0,0 +1,111 @@
+# Location: backend/tests/test_history_writer.py
+"""
+HistoryWriter: batches are flushed by the drain task, stop() drains
+whatever is still queued, and one bad row does not drop its batch
+"""
+
+import asyncio
+import importlib
+import logging
+import threading
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.validation_history import ValidationHistory
+from app.services.validation.history_writer import HistoryWriter
+
+# The package re-exports the shared instance under the module's name
+history_writer_module = importlib.import_module('app.services.validation.history_writer')
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """In-memory SQLite history table shared with the writer thread"""
+    engine = create_engine(
+        'sqlite://',
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False}
+    )
+    ValidationHistory.__table__.create(engine)
+
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(history_writer_module, 'SessionLocal', factory)
+
+    yield factory
+    engine.dispose()
+
+
+def _entry(skill_id):
+    return {'skill_id': skill_id, 'validator_user': 'tester', 'action': 'approved'}
+
+
+def _skill_ids(factory):
+    with factory() as db:
+        return sorted(db.execute(select(ValidationHistory.skill_id)).scalars())
+
+
+def test_drain_task_flushes_batches(session_factory):
+    async def scenario():
+        writer = HistoryWriter(flush_interval=0.01, batch_size=2)
+        writer.start()
+
+        for skill_id in range(5):
+            writer.enqueue(_entry(skill_id))
+
+        # Written by the drain task, before stop()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(_skill_ids(session_factory)) == 5:
+                break
+        written = _skill_ids(session_factory)
+
+        await writer.stop()
+        return written
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+
+
+def test_stop_drains_collected_and_queued_entries(session_factory):
+    async def scenario():
+        # Long interval: nothing is flushed until stop()
+        writer = HistoryWriter(flush_interval=60, batch_size=500)
+        writer.start()
+
+        writer.enqueue(_entry(1))
+        writer.enqueue(_entry(2))
+        await asyncio.sleep(0.05)
+
+        # Partially collected batch, plus an entry from a worker thread
+        assert writer._batch
+        thread = threading.Thread(target=writer.enqueue, args=(_entry(3),))
+        thread.start()
+        thread.join()
+
+        assert _skill_ids(session_factory) == []
+        await writer.stop()
+
+        assert not writer.is_running
+
+    asyncio.run(scenario())
+    assert _skill_ids(session_factory) == [1, 2, 3]
+
+
+def test_failed_batch_is_retried_row_by_row(session_factory, caplog):
+    async def scenario():
+        writer = HistoryWriter(flush_interval=60)
+        writer.start()
+
+        writer.enqueue(_entry(1))
+        writer.enqueue(_entry(None))  # skill_id is NOT NULL
+        writer.enqueue(_entry(2))
+
+        await writer.stop()
+
+    with caplog.at_level(logging.ERROR, logger=history_writer_module.__name__):
+        asyncio.run(scenario())
+
+    assert _skill_ids(session_factory) == [1, 2]
+    assert 'Dropped validation history row' in caplog.text
@@ -0,0 +1,95 @@
+# Location: backend/tests/test_skill_demand.py
+"""
+SkillDemandService Python path: frequency + co-occurrence read the
+jobs once and match the list-based analyses
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services.analytics import skill_demand
+from app.services.analytics.skill_demand import SkillDemandService
+
+
+TOKENS = [
+    {'skills': {'top': ['Python', 'SQL', 'Docker']}},
+    {'skills': {'top': ['python', 'sql']}},
+    {'skills': {'skills': ['Python', {'normalized': 'docker'}]}},
+    {'skills': {'categorized': {'backend': ['Django', 'SQL'], 'database': ['python']}}},
+    {'skills': ['sql', 'docker']},
+    {'skills': {'count': 0}},
+]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Service on the Python path, reading TOKENS instead of the jobs table"""
+    monkeypatch.setattr(skill_demand, '_TOKENS_IS_JSON', False)
+
+    service = SkillDemandService(db=None)
+    service.reads = 0
+
+    def iter_jobs(**filters):
+        service.reads += 1
+        for job_id, tokens in enumerate(TOKENS, 1):
+            job = service._parse_job_row((job_id, 'Job', None, None, None, json.dumps(tokens), None))
+            if job and job['skills']:
+                yield job
+
+    monkeypatch.setattr(service, 'iter_jobs', iter_jobs)
+    return service
+
+
+def _pair_counts(result):
+    return {(pair['skill_1'], pair['skill_2']): pair['cooccurrence_count'] for pair in result['pairs']}
+
+
+def test_cooccurrence_reuses_frequency_pass(service):
+    jobs = service.load_frequency(track_pairs=True)
+    result = service.load_cooccurrence(min_support=2)
+
+    assert service.reads == 1
+    assert jobs == 5
+    assert service.skills_frequency == {'python': 4, 'sql': 4, 'docker': 3, 'django': 1}
+    assert _pair_counts(result) == {
+        ('python', 'sql'): 3,
+        ('docker', 'python'): 2,
+        ('docker', 'sql'): 2,
+    }
+
+    # Same result as the list-based analyses
+    expected = SkillDemandService(db=None)
+    jobs_data = list(service.iter_jobs())
+    expected.analyze_frequency(jobs_data)
+    assert result == expected.analyze_cooccurrence(jobs_data, min_support=2)
+
+
+def test_cooccurrence_with_other_filters_reads_again(service):
+    service.load_frequency(track_pairs=True)
+    service.load_cooccurrence(min_support=2, limit=3)
+
+    assert service.reads == 2
+
+
+
+def test_failed_sql_probe_is_not_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(skill_demand, '_TOKENS_IS_JSON', None)
+
+    # SQLite has no information_schema, so the probe fails
+    engine = create_engine(f"sqlite:///{tmp_path / 'probe.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE pending_work (x INTEGER)"))
+
+    with Session(engine) as db:
+        db.execute(text("INSERT INTO pending_work VALUES (1)"))
+
+        assert SkillDemandService(db)._supports_sql_aggregation() is False
+        assert skill_demand._TOKENS_IS_JSON is None
+
+        # The caller's uncommitted work survives the failed probe
+        assert db.execute(text("SELECT COUNT(*) FROM pending_work")).scalar() == 1
+
+    engine.dispose()
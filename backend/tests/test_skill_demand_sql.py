@@ -0,0 +1,108 @@
+# Location: backend/tests/test_skill_demand_sql.py
+"""
+SkillDemandService: MySQL aggregation matches the Python path
+
+Both paths run over the same jobs fixture, which covers every
+tokens.skills shape _parse_job_row understands.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import text
+
+from app.services.analytics import skill_demand
+from app.services.analytics.skill_demand import SkillDemandService
+
+
+JOBS_DDL = """
+CREATE TABLE jobs (
+    id INT PRIMARY KEY,
+    judul VARCHAR(500) NOT NULL,
+    perusahaan VARCHAR(255),
+    lokasi VARCHAR(255),
+    level VARCHAR(100),
+    tokens JSON,
+    tanggal_posting DATE,
+    is_tokenized BOOLEAN DEFAULT FALSE
+)
+"""
+
+# tokens per job id
+TOKENS = {
+    # Format 1: top list, with duplicates, case/space variants and junk
+    1: {'skills': {'count': 4, 'top': ['Python', ' python ', 'SQL', '', 5], 'categories': ['programming_language']}},
+    2: {'skills': {'top': ['sql', 'Docker', None]}},
+    # top present but not a list: no skills, later formats ignored
+    3: {'skills': {'top': 'python', 'skills': ['java']}},
+    # Format 2: nested skills list with names and normalized dicts
+    4: {'skills': {'skills': ['Java', {'normalized': 'Docker', 'category': 'devops'}, {'normalized': 3}, {}]}},
+    # Format 3: categorized
+    5: {'skills': {'categorized': {'backend': ['Django', 'SQL'], 'tools': ['Figma', 7]}}},
+    # Format 4: bare list
+    6: {'skills': ['React', {'normalized': 'python'}, ['nested']]},
+    # No skills at all
+    7: {'skills': {'count': 0}},
+    8: {'other': ['python']},
+    9: {'skills': {'top': []}},
+}
+
+
+@pytest.fixture
+def jobs_db(mysql_session_factory):
+    """Session over a jobs table filled with TOKENS"""
+    db = mysql_session_factory()
+    db.execute(text("DROP TABLE IF EXISTS jobs"))
+    db.execute(text(JOBS_DDL))
+    db.execute(
+        text("""
+            INSERT INTO jobs (id, judul, tokens, tanggal_posting, is_tokenized)
+            VALUES (:id, :judul, :tokens, '2025-12-01', TRUE)
+        """),
+        [{'id': job_id, 'judul': f'Job {job_id}', 'tokens': json.dumps(tokens)} for job_id, tokens in TOKENS.items()]
+    )
+    # Not tokenized: ignored by both paths
+    db.execute(text("""
+        INSERT INTO jobs (id, judul, tokens, is_tokenized)
+        VALUES (10, 'Job 10', '{"skills": {"top": ["cobol"]}}', FALSE)
+    """))
+    db.commit()
+
+    yield db
+
+    db.rollback()
+    db.execute(text("DROP TABLE jobs"))
+    db.commit()
+    db.close()
+
+
+def _run(db, monkeypatch, use_sql):
+    """Frequency + co-occurrence with the SQL or Python path forced"""
+    monkeypatch.setattr(skill_demand, '_TOKENS_IS_JSON', use_sql)
+
+    service = SkillDemandService(db)
+    jobs = service.load_frequency()
+    cooccurrence = service.load_cooccurrence(min_support=1)
+    return jobs, dict(service.skills_frequency), cooccurrence
+
+
+def test_sql_aggregation_matches_python(jobs_db, monkeypatch):
+    python_jobs, python_freq, python_pairs = _run(jobs_db, monkeypatch, use_sql=False)
+    sql_jobs, sql_freq, sql_pairs = _run(jobs_db, monkeypatch, use_sql=True)
+
+    assert python_jobs == 5
+    assert python_freq == {
+        'python': 2, 'sql': 3, 'docker': 2, 'java': 1,
+        'django': 1, 'figma': 1, 'react': 1,
+    }
+
+    assert sql_jobs == python_jobs
+    assert sql_freq == python_freq
+
+    def pair_counts(result):
+        return {
+            (pair['skill_1'], pair['skill_2']): pair['cooccurrence_count']
+            for pair in result['pairs']
+        }
+
+    assert pair_counts(sql_pairs) == pair_counts(python_pairs)
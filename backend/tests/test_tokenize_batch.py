@@ -0,0 +1,44 @@
+# Location: backend/tests/test_tokenize_batch.py
+"""
+BaseTokenizer.tokenize_batch: each distinct text is tokenized once,
+and repeated inputs still get independent result objects
+"""
+
+from app.services.preprocessing.tokenizers.base_tokenizer import BaseTokenizer
+
+
+class CountingTokenizer(BaseTokenizer):
+    """Splits on whitespace and counts tokenize() calls"""
+
+    def __init__(self):
+        super().__init__(use_cleaner=False, use_indonesian_nlp=False)
+        self.calls = 0
+
+    def tokenize(self, text):
+        self.calls += 1
+        return {'original': text, 'tokens': text.split(), 'meta': {'count': len(text.split())}}
+
+
+def test_tokenize_batch_tokenizes_each_distinct_text_once():
+    tokenizer = CountingTokenizer()
+
+    results = tokenizer.tokenize_batch(['a b', 'c', 'a b', 'a b'])
+
+    assert tokenizer.calls == 2
+    assert [r['tokens'] for r in results] == [['a', 'b'], ['c'], ['a', 'b'], ['a', 'b']]
+
+
+def test_tokenize_batch_repeats_are_independent():
+    tokenizer = CountingTokenizer()
+
+    first, _, second, third = tokenizer.tokenize_batch(['a b', 'c', 'a b', 'a b'])
+
+    assert first is not second and second is not third
+    assert first['tokens'] is not second['tokens']
+    assert first['meta'] is not second['meta']
+
+    second['tokens'].append('x')
+    second['meta']['count'] = 99
+
+    assert first == {'original': 'a b', 'tokens': ['a', 'b'], 'meta': {'count': 2}}
+    assert third == first
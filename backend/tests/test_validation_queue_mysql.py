@@ -0,0 +1,121 @@
+# Location: backend/tests/test_validation_queue_mysql.py
+"""
+Validation queue behaviour that depends on MySQL: the add_to_queue
+upsert and bulk_validate with rows locked by another transaction
+"""
+
+import pytest
+
+from app.models.skill_category import SkillCategory
+from app.models.skill_dictionary import SkillsDictionary
+from app.models.validation_history import ValidationHistory
+from app.models.validation_queue import ValidationQueue
+from app.database.base import Base
+from app.services.validation.queue_manager import QueueManagerService
+from app.services.validation.skill_validator import SkillValidatorService
+
+
+TABLES = [
+    SkillCategory.__table__,
+    SkillsDictionary.__table__,
+    ValidationQueue.__table__,
+    ValidationHistory.__table__,
+]
+
+
+@pytest.fixture
+def validation_tables(mysql_engine):
+    """Fresh validation tables on the scratch database"""
+    Base.metadata.drop_all(mysql_engine, tables=TABLES)
+    Base.metadata.create_all(mysql_engine, tables=TABLES)
+    yield
+    Base.metadata.drop_all(mysql_engine, tables=TABLES)
+
+
+def test_add_to_queue_upsert_increments_source_count(validation_tables, mysql_session_factory):
+    with mysql_session_factory() as db:
+        queue = QueueManagerService(db)
+
+        first = queue.add_to_queue('python', source_count=3)
+        assert (first.source_count, first.priority) == (3, 3)
+
+        second = queue.add_to_queue('python', source_count=98)
+        db.refresh(second)
+
+        assert second.id == first.id
+        assert second.source_count == 101
+        assert second.priority == 100  # capped
+        assert db.query(ValidationQueue).count() == 1
+
+
+def test_bulk_validate_reports_locked_and_missing_ids(validation_tables, mysql_session_factory):
+    with mysql_session_factory() as setup:
+        locked = ValidationQueue(skill_name='docker', status='pending')
+        free = ValidationQueue(skill_name='kubernetes', status='pending')
+        setup.add_all([locked, free])
+        setup.commit()
+        locked_id, free_id = locked.id, free.id
+    missing_id = free_id + 1000
+
+    other = mysql_session_factory()
+    db = mysql_session_factory()
+    try:
+        # Another reviewer holds the row lock
+        other.query(ValidationQueue).filter(
+            ValidationQueue.id == locked_id
+        ).with_for_update().one()
+
+        results = SkillValidatorService(db).bulk_validate(
+            [locked_id, free_id, missing_id], 'skip'
+        )
+    finally:
+        other.rollback()
+        other.close()
+        db.close()
+
+    details = {detail['queue_id']: detail for detail in results['details']}
+
+    assert (results['succeeded'], results['failed']) == (1, 2)
+    assert details[free_id]['success'] is True
+    assert details[locked_id]['error'] == 'Queue item is being validated by another request'
+    assert details[missing_id]['error'] == 'Queue item not found'
+
+    with mysql_session_factory() as check:
+        statuses = dict(check.query(ValidationQueue.id, ValidationQueue.status))
+    assert statuses == {locked_id: 'pending', free_id: 'skipped'}
+
+
+def test_bulk_validate_reports_failed_reject_with_empty_prefetch(
+    validation_tables, mysql_session_factory, monkeypatch
+):
+    # No dictionary rows, so the reject prefetch map is empty
+    with mysql_session_factory() as setup:
+        broken = ValidationQueue(skill_name='broken', status='pending')
+        rust = ValidationQueue(skill_name='rust', status='pending')
+        setup.add_all([broken, rust])
+        setup.commit()
+        broken_id, rust_id = broken.id, rust.id
+
+    reject_skill = SkillValidatorService.reject_skill
+
+    def failing_reject(self, queue_item, **kwargs):
+        if queue_item.skill_name == 'broken':
+            raise RuntimeError('reject failed')
+        return reject_skill(self, queue_item, **kwargs)
+
+    monkeypatch.setattr(SkillValidatorService, 'reject_skill', failing_reject)
+
+    with mysql_session_factory() as db:
+        results = SkillValidatorService(db).bulk_validate([broken_id, rust_id], 'reject')
+
+    details = {detail['queue_id']: detail for detail in results['details']}
+
+    assert (results['succeeded'], results['failed']) == (1, 1)
+    assert details[broken_id] == {'queue_id': broken_id, 'success': False, 'error': 'reject failed'}
+    assert details[rust_id]['success'] is True
+
+    with mysql_session_factory() as check:
+        statuses = dict(check.query(ValidationQueue.id, ValidationQueue.status))
+        rejected = check.query(SkillsDictionary.skill_name).all()
+    assert statuses == {broken_id: 'pending', rust_id: 'completed'}
+    assert rejected == [('rust',)]